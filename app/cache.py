@@ -0,0 +1,116 @@
+"""
+In-process caching for read-mostly catalog data.
+Keeps serialized JSON response bodies in an LRU map with per-entry expiry, and
+tracks the catalog data generation that memoized loaders are keyed on.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+from .database import read_catalog_version
+from .responses import dumps
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entry when full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry (call after catalog writes)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared cache for catalog endpoint bodies
+response_cache = TTLCache(maxsize=512, ttl=300)
+
+
+# Catalog data generation: the database's catalog_version, which every reseed bumps
+# (init_db.py runs in its own process). Re-read at most once per interval, so a
+# reseed reaches a running server within that time; memoized loaders key on it.
+GENERATION_CHECK_INTERVAL = 1.0
+
+_data_generation: Optional[int] = None
+_generation_checked_at = float("-inf")
+_generation_lock = threading.Lock()
+
+
+def data_generation() -> int:
+    """Current catalog data generation (drops cached bodies when it changes)."""
+    global _data_generation, _generation_checked_at
+    if time.monotonic() - _generation_checked_at < GENERATION_CHECK_INTERVAL:
+        return _data_generation
+    with _generation_lock:
+        if time.monotonic() - _generation_checked_at >= GENERATION_CHECK_INTERVAL:
+            generation = read_catalog_version()
+            if generation != _data_generation:
+                response_cache.clear()
+                _data_generation = generation
+            _generation_checked_at = time.monotonic()
+    return _data_generation
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn endpoint arguments into a hashable cache key component."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def cached_response(ttl: Optional[float] = None, cache: TTLCache = response_cache) -> Callable:
+    """
+    Cache an endpoint's serialized JSON body keyed by the data generation and its path and
+    query arguments. The `db` session dependency is excluded from the key; exceptions are never cached.
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            key = (endpoint.__name__, data_generation(), _freeze({k: v for k, v in kwargs.items() if k != "db"}))
+            body = cache.get(key)
+            if body is None:
+                result = await endpoint(*args, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                body = dumps(jsonable_encoder(result))
+                cache.set(key, body, ttl)
+            return Response(content=body, media_type="application/json")
+        return wrapper
+    return decorator
@@ -3,16 +3,113 @@ Database configuration and models for the AI-powered trip planner.
 Uses SQLAlchemy ORM with SQLite for development and easy deployment.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, Text, JSON, ForeignKey, Table
+from sqlalchemy import create_engine, event, func, inspect, make_url, select, text, update, Column, Integer, String, Float, Boolean, Text, JSON, ForeignKey, Table, Index
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
+from sqlalchemy.pool import QueuePool
+from contextlib import contextmanager
 import os
+import sqlite3
+import orjson
 
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./travel_planner.db")
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+ENGINE_OPTIONS = dict(
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads
+)
+engine = create_engine(DATABASE_URL, **ENGINE_OPTIONS)
+
+# SQLite tuning applied to every new pooled connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",         # readers never block the writer
+    "PRAGMA synchronous=NORMAL",       # safe with WAL, far fewer fsyncs
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",      # 256 MB memory-mapped reads
+    "PRAGMA cache_size=-65536",        # 64 MB page cache
+    "PRAGMA foreign_keys=ON",
+)
+
+@event.listens_for(engine, "connect")
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for a read-heavy workload."""
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+def read_only_url(url: str):
+    """Return a read-only SQLite URI for a file database, or None if not applicable."""
+    url = make_url(url)
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:") or url.query:
+        return None
+    return f"sqlite:///file:{os.path.abspath(url.database)}?mode=ro&cache=shared&uri=true"
+
+# Read-only engine for GET endpoints; falls back to the main engine off SQLite
+READ_ONLY_URL = read_only_url(DATABASE_URL)
+ro_engine = create_engine(READ_ONLY_URL, **ENGINE_OPTIONS) if READ_ONLY_URL else engine
+
+# Reader connections only need the cache tuning, plus a guard against writes. They
+# share one page cache (cache=shared); read_uncommitted lets them skip the shared
+# cache's table read locks, which is safe because no connection in it ever writes.
+READ_ONLY_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA read_uncommitted=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+if ro_engine is not engine:
+    @event.listens_for(ro_engine, "connect")
+    def _apply_read_only_pragmas(dbapi_connection, connection_record):
+        """Mark each reader connection query-only and give it the same page cache tuning."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in READ_ONLY_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+# SQLite >= 3.45 can keep JSON in its pre-parsed binary JSONB encoding
+SQLITE_SUPPORTS_JSONB = engine.dialect.name == "sqlite" and sqlite3.sqlite_version_info >= (3, 45, 0)
+
+class JSONB(TypeDecorator):
+    """JSON column stored as SQLite JSONB when available, plain JSON text otherwise."""
+    impl = JSON
+    cache_ok = True
+
+    def bind_expression(self, bindvalue):
+        return func.jsonb(bindvalue, type_=self) if SQLITE_SUPPORTS_JSONB else bindvalue
+
+    def column_expression(self, column):
+        return func.json(column, type_=self) if SQLITE_SUPPORTS_JSONB else column
+
+class RawJSONText(TypeDecorator):
+    """JSON text read back as an orjson.Fragment, so serializers splice it in without parsing."""
+    impl = Text
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else orjson.Fragment(value)
+
+def raw_json(column):
+    """Select a JSON/JSONB column as compact JSON text wrapped in an orjson.Fragment."""
+    return func.json(column, type_=RawJSONText()).label(column.key)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=ro_engine)
 Base = declarative_base()
 
 # Association tables for many-to-many relationships
@@ -20,21 +117,40 @@ destination_categories = Table(
     'destination_categories',
     Base.metadata,
     Column('destination_id', Integer, ForeignKey('destinations.id')),
-    Column('category', String(50))
+    Column('category', String(50)),
+    Index('ix_destination_categories_category', 'category', 'destination_id')
 )
 
 activity_categories = Table(
     'activity_categories',
     Base.metadata,
     Column('activity_id', Integer, ForeignKey('activities.id')),
-    Column('category', String(50))
+    Column('category', String(50)),
+    Index('ix_activity_categories_category', 'category', 'activity_id')
 )
 
 hotel_amenities = Table(
     'hotel_amenities',
     Base.metadata,
     Column('hotel_id', Integer, ForeignKey('hotels.id')),
-    Column('amenity', String(50))
+    Column('amenity', String(50)),
+    Index('ix_hotel_amenities_amenity', 'amenity', 'hotel_id')
+)
+
+# Single-row catalog version, bumped in the same transaction as every reseed so
+# running servers (other processes) can tell their cached catalog is stale
+catalog_version = Table(
+    'catalog_version',
+    Base.metadata,
+    Column('id', Integer, primary_key=True),
+    Column('version', Integer, nullable=False)
+)
+
+# (junction table, owner column, value column, source table, source JSON column)
+JUNCTION_SOURCES = (
+    (destination_categories, 'destination_id', 'category', 'destinations', 'categories'),
+    (activity_categories, 'activity_id', 'category', 'activities', 'categories'),
+    (hotel_amenities, 'hotel_id', 'amenity', 'hotels', 'amenities'),
 )
 
 class Destination(Base):
@@ -51,7 +167,7 @@ class Destination(Base):
     longitude = Column(Float)
     
     # Climate data
-    best_months = Column(JSON)  # List of month numbers
+    best_months = Column(JSONB)  # List of month numbers
     avg_temp_min = Column(Integer)
     avg_temp_max = Column(Integer)
     
@@ -62,14 +178,14 @@ class Destination(Base):
     budget_daily_luxury = Column(Integer)
     
     # Popular areas
-    popular_areas = Column(JSON)  # List of area names
+    popular_areas = Column(JSONB)  # List of area names
     
     # Relationships
     hotels = relationship("Hotel", back_populates="destination")
     activities = relationship("Activity", back_populates="destination")
     
     # Categories (many-to-many)
-    categories = Column(JSON)  # Store as JSON for simplicity
+    categories = Column(JSONB)  # Store as JSON for simplicity
 
 class Hotel(Base):
     __tablename__ = "hotels"
@@ -90,10 +206,15 @@ class Hotel(Base):
     price_luxury = Column(Integer)
     
     # Amenities
-    amenities = Column(JSON)  # List of amenities
+    amenities = Column(JSONB)  # List of amenities
     
     # Relationships
     destination = relationship("Destination", back_populates="hotels")
+    
+    __table_args__ = (
+        Index("ix_hotel_dest_cat_rating", destination_id, category, rating.desc()),
+        Index("ix_hotel_dest_rating", destination_id, rating.desc()),
+    )
 
 class Activity(Base):
     __tablename__ = "activities"
@@ -116,10 +237,15 @@ class Activity(Base):
     cost_luxury = Column(Integer)
     
     # Categories
-    categories = Column(JSON)  # List of categories
+    categories = Column(JSONB)  # List of categories
     
     # Relationships
     destination = relationship("Destination", back_populates="activities")
+    
+    __table_args__ = (
+        Index("ix_activity_dest_type", destination_id, type),
+        Index("ix_activity_dest_rating", destination_id, rating.desc()),
+    )
 
 class TripTemplate(Base):
     __tablename__ = "trip_templates"
@@ -129,40 +255,131 @@ class TripTemplate(Base):
     description = Column(Text)
     
     # Template preferences
-    interests = Column(JSON)  # List of interests
+    interests = Column(JSONB)  # List of interests
     budget_type = Column(String(20))
     travel_style = Column(String(20))
     accommodation_type = Column(String(20))
     activity_intensity = Column(String(20))
     
     # Recommendations
-    recommended_destinations = Column(JSON)  # List of destination keys
+    recommended_destinations = Column(JSONB)  # List of destination keys
     duration_min = Column(Integer)
     duration_max = Column(Integer)
-    highlights = Column(JSON)  # List of highlights
+    highlights = Column(JSONB)  # List of highlights
 
 class UserPreferenceTemplate(Base):
     __tablename__ = "user_preference_templates"
     
     id = Column(Integer, primary_key=True, index=True)
     profile_type = Column(String(50), unique=True)
-    interests = Column(JSON)
+    interests = Column(JSONB)
     budget_preference = Column(String(20))
     accommodation_type = Column(String(20))
     activity_intensity = Column(String(20))
     group_size_preference = Column(String(20))
 
-# Database dependency
-def get_db():
+# Short-lived session that hands its connection back to the pool on exit
+@contextmanager
+def session_scope():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+# Same as session_scope, but bound to the read-only engine
+@contextmanager
+def read_session_scope():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# Database dependency
+def get_db():
+    with session_scope() as db:
+        yield db
+
+# Read-only database dependency for GET endpoints
+def get_ro_db():
+    with read_session_scope() as db:
+        yield db
+
 # Create tables
+def tables_exist() -> bool:
+    """Check whether every mapped table is already present in the database."""
+    return set(Base.metadata.tables).issubset(inspect(engine).get_table_names())
+
 def create_tables():
-    Base.metadata.create_all(bind=engine)
+    # Skip the per-table DDL on warm starts; the index and JSONB steps below are
+    # idempotent and always run so existing databases pick up schema additions
+    if not tables_exist():
+        Base.metadata.create_all(bind=engine)
+    # create_all skips indexes on tables that already exist
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    migrate_json_to_jsonb()
+
+def migrate_json_to_jsonb():
+    """Convert JSON columns still holding text into JSONB (no-op without JSONB support)."""
+    if not SQLITE_SUPPORTS_JSONB:
+        return
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for column in table.columns:
+                if isinstance(column.type, JSONB):
+                    conn.exec_driver_sql(
+                        f"UPDATE {table.name} SET {column.name} = jsonb({column.name}) "
+                        f"WHERE typeof({column.name}) = 'text'"
+                    )
+
+def rebuild_junction_tables(conn, only_if_empty: bool = False):
+    """Rebuild the category/amenity junction tables inside the caller's transaction (connection or session)."""
+    for junction, owner_column, value_column, source_table, source_column in JUNCTION_SOURCES:
+        if only_if_empty and conn.execute(junction.select().limit(1)).first():
+            continue
+        conn.execute(junction.delete())
+        conn.execute(text(
+            f"INSERT INTO {junction.name} ({owner_column}, {value_column}) "
+            f"SELECT {source_table}.id, json_each.value "
+            f"FROM {source_table}, json_each({source_table}.{source_column})"
+        ))
+
+def sync_junction_tables(only_if_empty: bool = False):
+    """Rebuild the category/amenity junction tables from the JSON list columns."""
+    with engine.begin() as conn:
+        rebuild_junction_tables(conn, only_if_empty)
+
+def read_catalog_version() -> int:
+    """Current catalog version (0 before the first seed)."""
+    with ro_engine.connect() as conn:
+        return conn.execute(select(catalog_version.c.version)).scalar() or 0
+
+def bump_catalog_version(db) -> None:
+    """Advance the catalog version inside the caller's transaction."""
+    bumped = db.execute(update(catalog_version).values(version=catalog_version.c.version + 1))
+    if not bumped.rowcount:
+        db.execute(catalog_version.insert().values(id=1, version=1))
+
+# Connection pool lifecycle
+def warm_pool(connections: int = 4):
+    """Open pooled connections up front and touch every table so their page caches start hot."""
+    for pool_engine in {engine, ro_engine}:
+        opened = [pool_engine.connect() for _ in range(min(connections, pool_engine.pool.size()))]
+        try:
+            for conn in opened:
+                for table in Base.metadata.sorted_tables:
+                    conn.exec_driver_sql(f"SELECT count(*) FROM {table.name}")
+        finally:
+            for conn in opened:
+                conn.close()
+
+def close_pool():
+    """Close every pooled connection (called on application shutdown)."""
+    engine.dispose()
+    ro_engine.dispose()
 
 if __name__ == "__main__":
     create_tables()
@@ -3,18 +3,30 @@ FastAPI backend for AI-powered trip planner.
 Clean, database-driven architecture with repository pattern.
 """
 
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional, Dict, Any
-import traceback
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional, Dict, Any, Tuple
+import asyncio
+import os
+import json
+import hashlib
+import orjson
 from sqlalchemy.orm import Session
 from pathlib import Path
+from pydantic import TypeAdapter
 
-from .models import TripRequest, TripRecommendation, EnhancedActivity, EnhancedHotel, BudgetType
-from .database import get_db, create_tables
+from .models import TripRequest, SuggestRequest, TripRecommendation, EnhancedActivity, EnhancedHotel, BudgetType, BudgetTier
+from .database import (
+    get_ro_db, session_scope, read_session_scope, create_tables, sync_junction_tables, warm_pool, close_pool
+)
 from .services import TravelDataService, TripPlanningService, AnalyticsService
+from .cache import cached_response, response_cache, data_generation
+from .responses import OrjsonResponse, dumps
+from .logging_config import logger, setup_logging, shutdown_logging
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -22,7 +34,8 @@ app = FastAPI(
     description="Personalized trip planning with AI recommendations, budget optimization, and real-time conditions",
     version="2.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=OrjsonResponse
 )
 
 # CORS middleware
@@ -34,32 +47,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files
+# Compress large JSON lists (destinations, activities, hotels, trip plans)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Mount static files (paths resolved once at import)
 static_path = Path(__file__).parent.parent / "static"
+index_html_path = static_path / "index.html"
 if static_path.exists():
     app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    print("🌍 Starting AI-Powered Trip Planner v2.0...")
-    print("📍 Server will be available at: http://localhost:8000")
-    print("📚 API Documentation: http://localhost:8000/api/docs")
-    print("🎯 Frontend Interface: http://localhost:8000")
-    
-    # Create database tables
-    create_tables()
-    print("🗄️ Database initialized successfully")
-
-@app.get("/", response_class=HTMLResponse)
-async def read_root():
-    """Serve the main frontend page."""
-    html_path = Path(__file__).parent.parent / "static" / "index.html"
-    if html_path.exists():
-        return HTMLResponse(content=html_path.read_text(), status_code=200)
-    
-    # Fallback HTML
-    return HTMLResponse(content="""
+# Fallback page served when static/index.html is missing (encoded once at import)
+FALLBACK_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -82,112 +80,241 @@ async def read_root():
         </div>
     </body>
     </html>
-    """, status_code=200)
+    """.encode("utf-8")
+
+# Serializers for the precomputed content responses
+activity_list_adapter = TypeAdapter(List[EnhancedActivity])
+hotel_list_adapter = TypeAdapter(List[EnhancedHotel])
+
+def render_activities(activities: List[Dict[str, Any]]) -> bytes:
+    """Serialize repository activity dicts as the /activities response body."""
+    return activity_list_adapter.dump_json([EnhancedActivity.model_validate(activity) for activity in activities])
+
+def render_hotels(hotels: List[Dict[str, Any]]) -> bytes:
+    """Serialize repository hotel dicts as the /hotels response body."""
+    return hotel_list_adapter.dump_json([EnhancedHotel.model_validate(hotel) for hotel in hotels])
+
+def preload_destinations() -> Dict[str, bytes]:
+    """Serialize every destination once so detail lookups skip the database."""
+    with read_session_scope() as db:
+        data_service = TravelDataService(db)
+        return {
+            key: data_service.get_destination_json(key)
+            for key in data_service.get_destination_keys()
+        }
+
+def preload_catalog_lists():
+    """Load the destination list and both template lists into the service memo once."""
+    with read_session_scope() as db:
+        data_service = TravelDataService(db)
+        data_service.get_all_destinations()
+        data_service.get_trip_templates()
+        data_service.get_user_preference_templates()
+
+def precompute_content_cache() -> Tuple[Dict[tuple, bytes], Dict[tuple, bytes]]:
+    """Render every destination's activities and hotels once per budget type."""
+    activity_cache, hotel_cache = {}, {}
+    with read_session_scope() as db:
+        data_service = TravelDataService(db)
+        for key in data_service.get_destination_keys():
+            activities_body = render_activities(data_service.get_activities_for_destination(key))
+            for budget_type in BudgetType:
+                hotels = data_service.get_hotels_for_destination(key, budget_type.value)
+                activity_cache[(key, budget_type.value)] = activities_body
+                hotel_cache[(key, budget_type.value)] = render_hotels(hotels)
+    return activity_cache, hotel_cache
+
+def rebuild_catalog_caches(generation: int):
+    """Build every preloaded body and list memo for a catalog generation, then swap them in together."""
+    destinations_by_key = preload_destinations()
+    activity_cache, hotel_cache = precompute_content_cache()
+    preload_catalog_lists()
+    app.state.destinations_by_key = destinations_by_key
+    app.state.activity_cache = activity_cache
+    app.state.hotel_cache = hotel_cache
+    app.state.catalog_generation = generation
+
+async def _rebuild_catalog_caches_in_background(generation: int):
+    """Run rebuild_catalog_caches in the threadpool, logging instead of raising on failure."""
+    try:
+        await run_in_threadpool(rebuild_catalog_caches, generation)
+    except Exception:
+        logger.exception("Rebuilding catalog caches for generation %s failed", generation)
+
+def refresh_catalog_caches():
+    """
+    Start a rebuild off the event loop when the catalog generation changes.
+    The previous bodies keep being served until the rebuild swaps in the new ones.
+    """
+    generation = data_generation()
+    if generation == app.state.catalog_generation:
+        return
+    rebuild = getattr(app.state, "catalog_rebuild", None)
+    if rebuild is None or rebuild.done():
+        app.state.catalog_rebuild = asyncio.get_running_loop().create_task(
+            _rebuild_catalog_caches_in_background(generation)
+        )
+
+# Startup event
+@app.on_event("startup")
+async def startup_event():
+    setup_logging()
+    logger.info("Starting AI-Powered Trip Planner v2.0")
+    
+    # Create missing tables, indexes and JSONB columns
+    create_tables()
+    sync_junction_tables(only_if_empty=True)
+    warm_pool()
+    logger.info("Database initialized")
+    
+    rebuild_catalog_caches(data_generation())
+
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    close_pool()
+    shutdown_logging()
+
+@app.get("/", response_class=HTMLResponse)
+async def read_root(request: Request):
+    """Serve the main frontend page."""
+    try:
+        index_stat = os.stat(index_html_path)
+    except FileNotFoundError:
+        index_stat = None
+    
+    if index_stat is not None:
+        # FileResponse streams the file and sets ETag/Last-Modified from the stat
+        response = FileResponse(index_html_path, media_type="text/html", stat_result=index_stat)
+        etag = response.headers["etag"]
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"etag": etag})
+        return response
+    
+    return HTMLResponse(content=FALLBACK_HTML)
+
+# Static health payload, encoded once
+HEALTH_BODY = dumps({
+    "status": "healthy",
+    "service": "AI Trip Planner",
+    "version": "2.0.0",
+    "architecture": "Database-driven with Repository Pattern",
+    "features": [
+        "SQLAlchemy ORM with SQLite",
+        "Repository Pattern",
+        "Service Layer Architecture",
+        "Clean Data Separation",
+        "AI-powered recommendations",
+        "Budget optimization"
+    ]
+})
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "AI Trip Planner",
-        "version": "2.0.0",
-        "architecture": "Database-driven with Repository Pattern",
-        "features": [
-            "SQLAlchemy ORM with SQLite",
-            "Repository Pattern",
-            "Service Layer Architecture",
-            "Clean Data Separation",
-            "AI-powered recommendations",
-            "Budget optimization"
-        ]
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 # === DESTINATION ENDPOINTS ===
 
 @app.get("/destinations", response_model=List[dict])
-async def get_available_destinations(db: Session = Depends(get_db)):
+@cached_response()
+async def get_available_destinations(db: Session = Depends(get_ro_db)):
     """Get all available destinations with basic information."""
     try:
         data_service = TravelDataService(db)
         destinations = data_service.get_all_destinations()
         return destinations
     except Exception as e:
-        print(f"Error fetching destinations: {str(e)}")
+        logger.exception("Error fetching destinations")
         raise HTTPException(status_code=500, detail=f"Error fetching destinations: {str(e)}")
 
 @app.get("/destinations/{destination_key}")
-async def get_destination_details(destination_key: str, db: Session = Depends(get_db)):
+async def get_destination_details(destination_key: str, db: Session = Depends(get_ro_db)):
     """Get detailed information about a specific destination."""
     try:
+        refresh_catalog_caches()
+        body = app.state.destinations_by_key.get(destination_key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+        
         data_service = TravelDataService(db)
-        destination = data_service.get_destination_by_key(destination_key)
+        body = data_service.get_destination_json(destination_key)
         
-        if not destination:
+        if body is None:
             raise HTTPException(status_code=404, detail=f"Destination '{destination_key}' not found")
         
-        return destination
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error fetching destination {destination_key}: {str(e)}")
+        logger.exception("Error fetching destination %s", destination_key)
         raise HTTPException(status_code=500, detail=f"Error fetching destination: {str(e)}")
 
 @app.post("/destinations/suggest")
-async def suggest_destinations(
-    interests: List[str] = Query(...),
-    budget_type: BudgetType = Query(BudgetType.MID),
-    db: Session = Depends(get_db)
-):
+async def suggest_destinations(req: SuggestRequest):
     """Get destination suggestions based on interests and budget."""
+    # Scoring ignores interest order, so sorted interests make a stable cache key
+    cache_key = ("suggest_destinations", data_generation(), tuple(sorted(req.interests)), req.budget_type)
+    body = response_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    
     try:
-        trip_service = TripPlanningService(db)
-        suggestions = trip_service.suggest_destinations(interests, budget_type.value)
-        return {"suggestions": suggestions}
+        with read_session_scope() as db:
+            trip_service = TripPlanningService(db)
+            suggestions = trip_service.suggest_destinations(req.interests, req.budget_type)
+        body = dumps({"suggestions": suggestions})
+        response_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
-        print(f"Error suggesting destinations: {str(e)}")
+        logger.exception("Error suggesting destinations")
         raise HTTPException(status_code=500, detail=f"Error suggesting destinations: {str(e)}")
 
 # === TRIP PLANNING ENDPOINTS ===
 
 @app.post("/trip/plan", response_model=TripRecommendation)
-async def plan_trip(request: TripRequest, db: Session = Depends(get_db)):
+async def plan_trip(request: TripRequest):
     """Generate a personalized trip recommendation based on user preferences."""
     try:
-        print(f"Planning trip for destination: {request.destination}")
+        logger.info("Planning trip for destination: %s", request.destination)
         
-        trip_service = TripPlanningService(db)
-        recommendation = trip_service.plan_trip(request)
+        # Session is closed before FastAPI serializes the recommendation
+        with session_scope() as db:
+            trip_service = TripPlanningService(db)
+            recommendation = trip_service.plan_trip(request)
         
-        return recommendation
+        # Encode the dumped model with orjson (dates natively) instead of re-validating via response_model
+        return OrjsonResponse(recommendation.model_dump())
         
     except ValueError as e:
-        print(f"Validation error in trip planning: {str(e)}")
+        logger.info("Validation error in trip planning: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Error in trip planning: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("plan_trip failed", exc_info=e)
         raise HTTPException(status_code=500, detail=f"Error planning trip: {str(e)}")
 
 @app.post("/trip/optimize")
-async def optimize_trip(request: TripRequest, db: Session = Depends(get_db)):
+async def optimize_trip(request: TripRequest):
     """Optimize an existing trip based on new preferences or constraints."""
     try:
-        trip_service = TripPlanningService(db)
-        optimized_recommendation = trip_service.optimize_trip(request)
-        return optimized_recommendation
+        with session_scope() as db:
+            trip_service = TripPlanningService(db)
+            optimized_recommendation = trip_service.optimize_trip(request)
+        return OrjsonResponse(optimized_recommendation.model_dump())
     except Exception as e:
-        print(f"Error optimizing trip: {str(e)}")
+        logger.exception("optimize_trip failed", exc_info=e)
         raise HTTPException(status_code=500, detail=f"Error optimizing trip: {str(e)}")
 
 @app.get("/trip/templates")
-async def get_trip_templates(db: Session = Depends(get_db)):
+@cached_response()
+async def get_trip_templates(db: Session = Depends(get_ro_db)):
     """Get pre-defined trip templates for quick planning."""
     try:
         data_service = TravelDataService(db)
         templates = data_service.get_trip_templates()
         return templates
     except Exception as e:
-        print(f"Error fetching trip templates: {str(e)}")
+        logger.exception("Error fetching trip templates")
         raise HTTPException(status_code=500, detail=f"Error fetching templates: {str(e)}")
 
 # === CONTENT ENDPOINTS ===
@@ -196,93 +323,84 @@ async def get_trip_templates(db: Session = Depends(get_db)):
 async def get_destination_activities(
     destination_key: str,
     interests: Optional[List[str]] = Query(None),
-    budget_type: Optional[BudgetType] = Query(BudgetType.MID),
-    db: Session = Depends(get_db)
+    budget_type: BudgetTier = Query("mid")
 ):
     """Get activities for a specific destination with optional filtering."""
     try:
-        data_service = TravelDataService(db)
-        activities = data_service.get_activities_for_destination(destination_key, interests)
+        refresh_catalog_caches()
+        cache_key = (destination_key, budget_type)
+        if not interests and cache_key in app.state.activity_cache:
+            return Response(content=app.state.activity_cache[cache_key], media_type="application/json")
         
-        # Convert to EnhancedActivity format (simplified for now)
-        enhanced_activities = []
-        for activity in activities:
-            enhanced_activities.append(EnhancedActivity(
-                name=activity["name"],
-                type=activity["type"],
-                duration=activity["duration"],
-                cost_per_person=activity["cost"][budget_type.value],
-                rating=activity["rating"],
-                description=activity["description"],
-                best_time=activity["best_time"],
-                location=activity["location"],
-                categories=activity["categories"],
-                recommendation_score=4.5  # Default score
-            ))
+        with read_session_scope() as db:
+            data_service = TravelDataService(db)
+            activities = data_service.get_activities_for_destination(destination_key, interests)
         
-        return enhanced_activities
+        return Response(content=render_activities(activities), media_type="application/json")
     except Exception as e:
-        print(f"Error fetching activities for {destination_key}: {str(e)}")
+        logger.exception("Error fetching activities for %s", destination_key)
         raise HTTPException(status_code=500, detail=f"Error fetching activities: {str(e)}")
 
 @app.get("/hotels/{destination_key}", response_model=List[EnhancedHotel])
 async def get_destination_hotels(
     destination_key: str,
-    budget_type: Optional[BudgetType] = Query(BudgetType.MID),
-    db: Session = Depends(get_db)
+    budget_type: BudgetTier = Query("mid")
 ):
     """Get hotels for a specific destination with optional budget filtering."""
     try:
-        data_service = TravelDataService(db)
-        hotels = data_service.get_hotels_for_destination(destination_key, budget_type.value)
+        refresh_catalog_caches()
+        cache_key = (destination_key, budget_type)
+        if cache_key in app.state.hotel_cache:
+            return Response(content=app.state.hotel_cache[cache_key], media_type="application/json")
         
-        # Convert to EnhancedHotel format
-        enhanced_hotels = []
-        for hotel in hotels:
-            enhanced_hotels.append(EnhancedHotel(
-                name=hotel["name"],
-                category=hotel["category"],
-                rating=hotel["rating"],
-                price_per_night=hotel["price_per_night"][budget_type.value],
-                amenities=hotel["amenities"],
-                location=hotel["location"],
-                description=hotel["description"],
-                recommendation_score=4.3  # Default score
-            ))
+        with read_session_scope() as db:
+            data_service = TravelDataService(db)
+            hotels = data_service.get_hotels_for_destination(destination_key, budget_type)
         
-        return enhanced_hotels
+        return Response(content=render_hotels(hotels), media_type="application/json")
     except Exception as e:
-        print(f"Error fetching hotels for {destination_key}: {str(e)}")
+        logger.exception("Error fetching hotels for %s", destination_key)
         raise HTTPException(status_code=500, detail=f"Error fetching hotels: {str(e)}")
 
 # === ANALYTICS ENDPOINTS ===
 
 @app.get("/analytics/popular-destinations")
-async def get_popular_destinations(db: Session = Depends(get_db)):
+async def get_popular_destinations(db: Session = Depends(get_ro_db)):
     """Get analytics data for popular destinations and travel trends."""
     try:
         analytics_service = AnalyticsService(db)
         analytics = analytics_service.get_popular_destinations()
         return analytics
     except Exception as e:
-        print(f"Error fetching analytics: {str(e)}")
+        logger.exception("Error fetching analytics")
         raise HTTPException(status_code=500, detail=f"Error fetching analytics: {str(e)}")
 
 # === USER PREFERENCES ===
 
 @app.get("/user/preferences/templates")
-async def get_preference_templates(db: Session = Depends(get_db)):
+@cached_response()
+async def get_preference_templates(db: Session = Depends(get_ro_db)):
     """Get pre-defined user preference templates."""
     try:
         data_service = TravelDataService(db)
         templates = data_service.get_user_preference_templates()
         return templates
     except Exception as e:
-        print(f"Error fetching preference templates: {str(e)}")
+        logger.exception("Error fetching preference templates")
         raise HTTPException(status_code=500, detail=f"Error fetching templates: {str(e)}")
 
 # === BOOKING PROTOTYPE ===
 
+def booking_number(booking_request: dict) -> int:
+    """Derive a stable 5-digit booking number from the canonical request bytes."""
+    try:
+        payload = orjson.dumps(booking_request, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson rejects integers wider than 64 bits; the stdlib encoder does not
+        payload = json.dumps(booking_request, sort_keys=True, default=str).encode()
+    digest = hashlib.blake2b(payload, digest_size=8).digest()
+    return int.from_bytes(digest, "big") % 100000
+
 @app.post("/booking/initiate")
 async def initiate_booking(booking_request: dict):
     """
@@ -302,7 +420,7 @@ async def initiate_booking(booking_request: dict):
                 "Confirmation and ticketing system"
             ],
             "estimated_completion": "Phase 2 Development",
-            "booking_id": f"PROTO_{hash(str(booking_request)) % 100000:05d}",
+            "booking_id": f"PROTO_{booking_number(booking_request):05d}",
             "total_amount": booking_request.get("total_cost", 0),
             "currency": "INR"
         },
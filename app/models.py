@@ -1,6 +1,6 @@
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
+from typing import Annotated, List, Literal, Optional, Dict, Any, TypedDict
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import date, datetime
 from enum import Enum
 
 
@@ -23,7 +23,7 @@ class VisitPlace(BaseModel):
 
 class Itinerary(BaseModel):
     """Represents the itinerary for a single day."""
-    date: str
+    date: date
     number_of_persons: int
     places: Optional[List[VisitPlace]] = None   # ✅ places include events internally
 
@@ -31,8 +31,8 @@ class Itinerary(BaseModel):
 class Hotel(BaseModel):
     """Represents hotel details for accommodation during the trip."""
     name: str
-    check_in: str
-    check_out: str
+    check_in: date
+    check_out: date
     cost_per_night: float
     address: Optional[str] = None
 
@@ -40,8 +40,8 @@ class Hotel(BaseModel):
 class Trip(BaseModel):
     """The complete trip plan with all details."""
     destination: str
-    start_date: str
-    end_date: str
+    start_date: date
+    end_date: date
     travelers: int
     itinerary: List[Itinerary]
     hotels: Optional[List[Hotel]] = None
@@ -55,6 +55,10 @@ class BudgetType(str, Enum):
     LUXURY = "luxury"
 
 
+# Plain-string budget tier for request fields (validated as a literal set, no enum lookups)
+BudgetTier = Literal["budget", "mid", "luxury"]
+
+
 class TravelStyle(str, Enum):
     ADVENTURE = "adventure"
     CULTURAL = "cultural"
@@ -70,11 +74,15 @@ class AccommodationType(str, Enum):
     BOUTIQUE = "boutique"
 
 
+# Recommendation scores are on a 0-10 scale
+Score = Annotated[float, Field(ge=0, le=10)]
+
+
 # User preference and request models
 class UserPreferences(BaseModel):
     """User travel preferences for personalized recommendations."""
     interests: List[str] = Field(..., description="List of user interests (e.g., adventure, cultural, culinary)")
-    budget_type: BudgetType = Field(default=BudgetType.MID, description="Budget preference")
+    budget_type: BudgetTier = Field(default="mid", description="Budget preference")
     travel_style: TravelStyle = Field(default=TravelStyle.CULTURAL, description="Preferred travel style")
     accommodation_type: AccommodationType = Field(default=AccommodationType.MID, description="Accommodation preference")
     activity_intensity: str = Field(default="medium", description="Preferred activity intensity (low/medium/high)")
@@ -86,14 +94,20 @@ class UserPreferences(BaseModel):
 class TripRequest(BaseModel):
     """Request model for trip planning."""
     destination: str = Field(..., description="Destination city/country")
-    start_date: str = Field(..., description="Trip start date (YYYY-MM-DD)")
-    end_date: str = Field(..., description="Trip end date (YYYY-MM-DD)")
+    start_date: date = Field(..., description="Trip start date (YYYY-MM-DD)")
+    end_date: date = Field(..., description="Trip end date (YYYY-MM-DD)")
     travelers: int = Field(..., gt=0, description="Number of travelers")
     budget_total: Optional[float] = Field(default=None, description="Total budget for the trip")
     preferences: UserPreferences = Field(..., description="User travel preferences")
     special_requests: Optional[str] = Field(default=None, description="Any special requests or notes")
 
 
+class SuggestRequest(BaseModel):
+    """Request model for destination suggestions."""
+    interests: List[str] = Field(..., description="List of user interests (e.g., adventure, cultural, culinary)")
+    budget_type: BudgetTier = Field(default="mid", description="Budget preference")
+
+
 class WeatherInfo(BaseModel):
     """Weather information for destination."""
     temperature: int
@@ -102,6 +116,14 @@ class WeatherInfo(BaseModel):
     recommendation: str
 
 
+class WeatherDict(TypedDict):
+    """Weather conditions as built internally (unvalidated WeatherInfo fields)."""
+    temperature: int
+    condition: str
+    is_favorable: bool
+    recommendation: str
+
+
 class CostBreakdown(BaseModel):
     """Detailed cost breakdown for the trip."""
     accommodation: float
@@ -113,17 +135,35 @@ class CostBreakdown(BaseModel):
     per_day: float
 
 
+class CostBreakdownDict(TypedDict):
+    """Cost breakdown as built internally (unvalidated CostBreakdown fields)."""
+    accommodation: float
+    activities: float
+    food: float
+    transport: float
+    total: float
+    per_person: float
+    per_day: float
+
+
 class RecommendationScore(BaseModel):
     """Scoring details for recommendations."""
-    overall_score: float = Field(..., ge=0, le=10, description="Overall recommendation score (0-10)")
-    interest_match: float = Field(..., ge=0, le=10, description="How well it matches user interests")
-    budget_fit: float = Field(..., ge=0, le=10, description="How well it fits the budget")
-    weather_factor: float = Field(..., ge=0, le=10, description="Weather favorability score")
-    popularity_score: float = Field(..., ge=0, le=10, description="General popularity score")
+    overall_score: Score = Field(..., description="Overall recommendation score (0-10)")
+    interest_match: Score = Field(..., description="How well it matches user interests")
+    budget_fit: Score = Field(..., description="How well it fits the budget")
+    weather_factor: Score = Field(..., description="Weather favorability score")
+    popularity_score: Score = Field(..., description="General popularity score")
+
+
+# Enhanced* models are validated straight from repository row dicts; columns
+# the API does not expose are dropped rather than rejected
+CATALOG_ROW_CONFIG = ConfigDict(extra="ignore")
 
 
 class EnhancedActivity(BaseModel):
     """Enhanced activity model with recommendation scoring."""
+    model_config = CATALOG_ROW_CONFIG
+
     name: str
     type: str
     duration: int
@@ -138,6 +178,8 @@ class EnhancedActivity(BaseModel):
 
 class EnhancedHotel(BaseModel):
     """Enhanced hotel model with recommendation scoring."""
+    model_config = CATALOG_ROW_CONFIG
+
     name: str
     category: str
     rating: float
@@ -156,7 +198,7 @@ class TripRecommendation(BaseModel):
     recommended_hotels: List[EnhancedHotel]
     recommended_activities: List[EnhancedActivity]
     personalization_notes: List[str] = Field(default=[], description="Notes about personalization")
-    confidence_score: float = Field(..., ge=0, le=10, description="Overall confidence in recommendation")
+    confidence_score: Score = Field(..., description="Overall confidence in recommendation")
 
 
 class DestinationSuggestion(BaseModel):
@@ -167,5 +209,5 @@ class DestinationSuggestion(BaseModel):
     categories: List[str]
     best_months: List[int]
     avg_daily_budget: Dict[str, float]
-    match_score: float = Field(..., ge=0, le=10, description="How well it matches user preferences")
+    match_score: Score = Field(..., description="How well it matches user preferences")
     reasons: List[str] = Field(default=[], description="Reasons why this destination is recommended")
@@ -3,19 +3,144 @@ AI-powered recommendation engine for personalized trip planning.
 Implements sophisticated filtering, scoring, and optimization algorithms.
 """
 
-import random
-import math
-from typing import List, Dict, Any, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict
+import heapq
+from bisect import bisect_left
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import timedelta
+from functools import lru_cache
 
 from .models import (
     TripRequest, UserPreferences, TripRecommendation, Trip, Itinerary, 
     VisitPlace, Event, Hotel, WeatherInfo, CostBreakdown, RecommendationScore,
-    EnhancedActivity, EnhancedHotel, DestinationSuggestion
+    EnhancedActivity, EnhancedHotel, DestinationSuggestion, CostBreakdownDict
 )
+from .logging_config import logger
+from .repositories import DataRepository
 from sqlalchemy.orm import Session
-from typing import Optional
+
+
+# Related categories (and their weights) that each user interest matches
+INTEREST_WEIGHTS = {
+    "adventure": {"adventure": 1.0, "nature": 0.8, "sports": 0.7},
+    "cultural": {"cultural": 1.0, "historical": 0.9, "educational": 0.8},
+    "relaxation": {"relaxation": 1.0, "wellness": 0.9, "beach": 0.8},
+    "culinary": {"culinary": 1.0, "food": 1.0, "cultural": 0.6},
+    "nature": {"nature": 1.0, "adventure": 0.7, "photography": 0.8},
+    "historical": {"historical": 1.0, "cultural": 0.9, "educational": 0.8},
+    "urban": {"urban": 1.0, "entertainment": 0.8, "shopping": 0.7},
+    "spiritual": {"spiritual": 1.0, "cultural": 0.7, "wellness": 0.6}
+}
+
+
+@lru_cache(maxsize=None)
+def _mock_data():
+    """The mock_data fallback module, imported on first use and then reused."""
+    from . import mock_data
+    return mock_data
+
+
+@lru_cache(maxsize=256)
+def _interest_profile(user_interests: Tuple[str, ...]) -> Tuple[Dict[str, float], float]:
+    """
+    Collapse a user's interests into one category -> summed weight map and the
+    maximum achievable score, so matching an item is a single pass over its categories.
+    """
+    category_weights: Dict[str, float] = {}
+    max_possible_score = 0.0
+    
+    for user_interest in user_interests:
+        interest_weights = INTEREST_WEIGHTS.get(user_interest, {user_interest: 1.0})
+        max_possible_score += max(interest_weights.values())
+        
+        for category, weight in interest_weights.items():
+            category_weights[category] = category_weights.get(category, 0.0) + weight
+        if user_interest not in interest_weights:
+            category_weights[user_interest] = category_weights.get(user_interest, 0.0) + 1.0
+    
+    return category_weights, max_possible_score
+
+
+def _match_profile(profile: Tuple[Dict[str, float], float], item_categories: List[str]) -> float:
+    """Interest match (0-10) of an item's categories against a precomputed interest profile."""
+    category_weights, max_possible_score = profile
+    total_score = sum(category_weights.get(category, 0.0) for category in item_categories)
+    
+    # Normalize to 0-10 scale
+    if max_possible_score > 0:
+        normalized_score = (total_score / max_possible_score) * 10
+        return min(10.0, normalized_score)
+    
+    return 5.0
+
+
+# Budget type modifiers for the cost / budget ratio
+BUDGET_MULTIPLIERS = {"budget": 0.7, "mid": 1.0, "luxury": 1.5}
+
+# Budget fit score per adjusted cost ratio band: <=0.5 excellent, <=0.8 good,
+# <=1.0 acceptable, <=1.2 slightly over budget, above that over budget
+BUDGET_FIT_THRESHOLDS = (0.5, 0.8, 1.0, 1.2)
+BUDGET_FIT_SCORES = (10.0, 8.0, 6.0, 4.0, 2.0)
+
+
+def _budget_fit(item_cost: float, user_budget: float, multiplier: float) -> float:
+    """Budget fit score (0-10) for a cost against a budget already resolved to its tier multiplier."""
+    if user_budget <= 0:
+        return 8.0  # Default good score if no budget specified
+    
+    # Table lookup: first threshold the ratio does not exceed picks the score
+    return BUDGET_FIT_SCORES[bisect_left(BUDGET_FIT_THRESHOLDS, item_cost / user_budget / multiplier)]
+
+# Daily budget per tier when neither the database nor mock_data can price a trip
+DEFAULT_DAILY_BUDGET = {"budget": 2000, "mid": 4000, "luxury": 8000}
+
+# Share of the daily budget spent on each cost category
+COST_SPLIT = (("accommodation", 0.4), ("activities", 0.3), ("food", 0.2), ("transport", 0.1))
+
+
+def _split_trip_cost(daily_budget: float, days: int, travelers: int) -> CostBreakdownDict:
+    """Split the whole-trip budget (daily budget x days x travelers) by COST_SPLIT."""
+    total_cost = float(daily_budget * days * travelers)
+    breakdown = {category: total_cost * share for category, share in COST_SPLIT}
+    breakdown["total"] = total_cost
+    breakdown["per_person"] = total_cost / travelers
+    breakdown["per_day"] = total_cost / days
+    return breakdown
+
+
+def _location_ids(activities: List[Dict[str, Any]]) -> List[int]:
+    """Number each activity's location (same location, same id) for bitmask dedup."""
+    ids: Dict[str, int] = {}
+    return [ids.setdefault(activity["location"], len(ids)) for activity in activities]
+
+
+def _enhanced_hotel(hotel: Dict[str, Any], score: RecommendationScore) -> EnhancedHotel:
+    """Build an EnhancedHotel from a trusted catalog row without re-validating it."""
+    return EnhancedHotel.model_construct(
+        name=hotel["name"],
+        category=hotel["category"],
+        rating=float(hotel["rating"]),
+        price_per_night={tier: float(price) for tier, price in hotel["price_per_night"].items()},
+        amenities=list(hotel["amenities"]),
+        location=hotel["location"],
+        description=hotel["description"],
+        recommendation_score=score
+    )
+
+
+def _enhanced_activity(activity: Dict[str, Any], score: RecommendationScore) -> EnhancedActivity:
+    """Build an EnhancedActivity from a trusted catalog row without re-validating it."""
+    return EnhancedActivity.model_construct(
+        name=activity["name"],
+        type=activity["type"],
+        duration=activity["duration"],
+        cost={tier: float(cost) for tier, cost in activity["cost"].items()},
+        rating=float(activity["rating"]),
+        description=activity["description"],
+        best_time=activity["best_time"],
+        location=activity["location"],
+        categories=list(activity["categories"]),
+        recommendation_score=score
+    )
 
 
 class TripRecommendationEngine:
@@ -25,62 +150,64 @@ class TripRecommendationEngine:
     Now supports both database-driven and fallback approaches.
     """
     
-    def __init__(self, db: Optional[Session] = None):
+    def __init__(self, db: Optional[Session] = None, destinations_data: Optional[Dict[str, Any]] = None):
         self.db = db
-        self.interest_weights = {
-            "adventure": {"adventure": 1.0, "nature": 0.8, "sports": 0.7},
-            "cultural": {"cultural": 1.0, "historical": 0.9, "educational": 0.8},
-            "relaxation": {"relaxation": 1.0, "wellness": 0.9, "beach": 0.8},
-            "culinary": {"culinary": 1.0, "food": 1.0, "cultural": 0.6},
-            "nature": {"nature": 1.0, "adventure": 0.7, "photography": 0.8},
-            "historical": {"historical": 1.0, "cultural": 0.9, "educational": 0.8},
-            "urban": {"urban": 1.0, "entertainment": 0.8, "shopping": 0.7},
-            "spiritual": {"spiritual": 1.0, "cultural": 0.7, "wellness": 0.6}
-        }
+        self.interest_weights = INTEREST_WEIGHTS
+        # Callers holding an already loaded destinations map can seed the cache with it
+        self._destinations_cache: Optional[Dict[str, Any]] = destinations_data
+        self._weather_scores: Dict[Tuple[str, int], float] = {}
+        self._best_months_masks: Optional[Dict[str, int]] = None
     
     def _get_destinations_data(self) -> Dict[str, Any]:
-        """Get destinations data from database or fallback to mock_data."""
+        """Get destinations data from database or fallback to mock_data (loaded once per engine)."""
+        if self._destinations_cache is not None:
+            return self._destinations_cache
+        
         if self.db:
             try:
-                from .repositories import DataRepository
                 repo = DataRepository(self.db)
-                destinations = repo.get_all_destinations()
-                # Convert to the format expected by the recommendation engine
-                destinations_dict = {}
-                for dest in destinations:
-                    destinations_dict[dest.key] = {
-                        "name": dest.name,
-                        "country": dest.country,
-                        "categories": dest.categories,
-                        "description": dest.description,
-                        "best_months": dest.best_months,
-                        "avg_temp_range": {"min": dest.avg_temp_min, "max": dest.avg_temp_max},
-                        "currency": dest.currency,
-                        "avg_daily_budget": {
-                            "budget": dest.budget_daily_budget,
-                            "mid": dest.budget_daily_mid,
-                            "luxury": dest.budget_daily_luxury
-                        },
-                        "popular_areas": dest.popular_areas,
-                        "coordinates": {"lat": dest.latitude, "lng": dest.longitude}
-                    }
-                return destinations_dict
+                self._destinations_cache = repo.destinations.get_data_by_key()
+                return self._destinations_cache
             except Exception as e:
-                print(f"Warning: Database query failed, falling back to mock_data: {e}")
+                logger.warning("Database query failed, falling back to mock_data: %s", e)
         
         # Fallback to mock_data
-        from .mock_data import DESTINATIONS
-        return DESTINATIONS
+        self._destinations_cache = _mock_data().DESTINATIONS
+        return self._destinations_cache
+    
+    def invalidate_destinations_cache(self) -> None:
+        """Drop the memoized destinations and weather scores so the next call reloads them."""
+        self._destinations_cache = None
+        self._weather_scores.clear()
+        self._best_months_masks = None
+    
+    def _get_best_months_masks(self) -> Dict[str, int]:
+        """Per-destination 12-bit masks of best travel months (bit m set for month m)."""
+        if self._best_months_masks is None:
+            masks = {}
+            for key, dest_data in self._get_destinations_data().items():
+                if "best_months" in dest_data:
+                    mask = 0
+                    for month in dest_data["best_months"]:
+                        mask |= 1 << month
+                    masks[key] = mask
+            self._best_months_masks = masks
+        return self._best_months_masks
     
-    def _get_weather_info(self, destination: str, travel_month: int) -> WeatherInfo:
-        """Get weather information from database or fallback to mock_data."""
+    def _get_weather_info(self, destination: str, travel_month: int,
+                          dest_data: Optional[Dict[str, Any]] = None) -> WeatherInfo:
+        """
+        Get weather information from database or fallback to mock_data.
+        Pass dest_data when the caller already resolved the destination.
+        """
         try:
             # Simple weather info based on destination data
-            destinations_data = self._get_destinations_data()
-            dest_data = destinations_data.get(destination)
+            if dest_data is None:
+                dest_data = self._get_destinations_data().get(destination)
+            mask = self._get_best_months_masks().get(destination)
             
-            if dest_data and "best_months" in dest_data:
-                is_favorable = travel_month in dest_data["best_months"]
+            if dest_data and mask is not None:
+                is_favorable = bool((mask >> travel_month) & 1)
                 condition = "sunny" if is_favorable else "cloudy"
                 temp_range = dest_data.get("avg_temp_range", {"min": 20, "max": 30})
                 
@@ -91,12 +218,11 @@ class TripRecommendationEngine:
                     description=f"Weather is {'favorable' if is_favorable else 'acceptable'} for travel"
                 )
         except Exception as e:
-            print(f"Warning: Weather info generation failed: {e}")
+            logger.warning("Weather info generation failed: %s", e)
         
         # Fallback to mock_data
         try:
-            from .mock_data import get_weather_conditions
-            weather_data = get_weather_conditions(destination, travel_month)
+            weather_data = _mock_data().get_weather_conditions(destination, travel_month)
             return WeatherInfo(
                 condition=weather_data["condition"],
                 temperature=weather_data["temperature"],
@@ -112,60 +238,32 @@ class TripRecommendationEngine:
                 description="Weather conditions are generally favorable"
             )
     
-    def _calculate_trip_cost(self, destination: str, days: int, travelers: int, budget_type: str) -> Dict[str, float]:
-        """Calculate trip cost using database data or fallback to mock_data."""
+    def _calculate_trip_cost(self, destination: str, days: int, travelers: int, budget_type: str,
+                             dest_data: Optional[Dict[str, Any]] = None) -> CostBreakdownDict:
+        """
+        Calculate trip cost using database data or fallback to mock_data.
+        Pass dest_data when the caller already resolved the destination.
+        """
+        daily_budget = None
         try:
             # Try to calculate using database data
-            destinations_data = self._get_destinations_data()
-            dest_data = destinations_data.get(destination)
+            if dest_data is None:
+                dest_data = self._get_destinations_data().get(destination)
             
             if dest_data and "avg_daily_budget" in dest_data:
                 daily_budget = dest_data["avg_daily_budget"].get(budget_type, dest_data["avg_daily_budget"]["mid"])
-                
-                # Simple cost breakdown calculation
-                accommodation_cost = (daily_budget * 0.4) * days * travelers  # 40% for accommodation
-                activity_cost = (daily_budget * 0.3) * days * travelers       # 30% for activities
-                food_cost = (daily_budget * 0.2) * days * travelers           # 20% for food
-                transport_cost = (daily_budget * 0.1) * days * travelers      # 10% for local transport
-                
-                total_cost = accommodation_cost + activity_cost + food_cost + transport_cost
-                
-                return {
-                    "accommodation": accommodation_cost,
-                    "activities": activity_cost,
-                    "food": food_cost,
-                    "transport": transport_cost,
-                    "total": total_cost,
-                    "per_person": total_cost / travelers,
-                    "per_day": total_cost / days
-                }
         except Exception as e:
-            print(f"Warning: Database cost calculation failed, falling back to mock_data: {e}")
+            logger.warning("Database cost calculation failed, falling back to mock_data: %s", e)
         
-        # Fallback to mock_data
-        try:
-            from .mock_data import calculate_trip_cost
-            return calculate_trip_cost(destination, days, travelers, budget_type)
-        except Exception:
-            # Default cost calculation
-            base_daily_cost = {"budget": 2000, "mid": 4000, "luxury": 8000}
-            daily_budget = base_daily_cost.get(budget_type, 4000)
-            
-            accommodation_cost = (daily_budget * 0.4) * days * travelers
-            activity_cost = (daily_budget * 0.3) * days * travelers
-            food_cost = (daily_budget * 0.2) * days * travelers
-            transport_cost = (daily_budget * 0.1) * days * travelers
-            total_cost = accommodation_cost + activity_cost + food_cost + transport_cost
-            
-            return {
-                "accommodation": accommodation_cost,
-                "activities": activity_cost,
-                "food": food_cost,
-                "transport": transport_cost,
-                "total": total_cost,
-                "per_person": total_cost / travelers,
-                "per_day": total_cost / days
-            }
+        if daily_budget is None:
+            # Fallback to mock_data
+            try:
+                return _mock_data().calculate_trip_cost(destination, days, travelers, budget_type)
+            except Exception:
+                # Default cost calculation
+                daily_budget = DEFAULT_DAILY_BUDGET.get(budget_type, 4000)
+        
+        return _split_trip_cost(daily_budget, days, travelers)
     
     def calculate_interest_match_score(self, user_interests: List[str], item_categories: List[str]) -> float:
         """
@@ -174,72 +272,40 @@ class TripRecommendationEngine:
         if not user_interests or not item_categories:
             return 5.0  # Neutral score
         
-        total_score = 0.0
-        max_possible_score = 0.0
-        
-        for user_interest in user_interests:
-            interest_weights = self.interest_weights.get(user_interest, {user_interest: 1.0})
-            max_possible_score += max(interest_weights.values())
-            
-            for category in item_categories:
-                if category in interest_weights:
-                    total_score += interest_weights[category]
-                elif category == user_interest:
-                    total_score += 1.0
-        
-        # Normalize to 0-10 scale
-        if max_possible_score > 0:
-            normalized_score = (total_score / max_possible_score) * 10
-            return min(10.0, normalized_score)
-        
-        return 5.0
+        return _match_profile(_interest_profile(tuple(user_interests)), item_categories)
     
     def calculate_budget_fit_score(self, item_cost: float, user_budget: float, budget_type: str) -> float:
         """
         Calculate how well an item fits within the user's budget.
         """
-        if user_budget <= 0:
-            return 8.0  # Default good score if no budget specified
-        
-        cost_ratio = item_cost / user_budget
-        
-        # Budget type modifiers
-        budget_multipliers = {"budget": 0.7, "mid": 1.0, "luxury": 1.5}
-        adjusted_ratio = cost_ratio / budget_multipliers.get(budget_type, 1.0)
-        
-        if adjusted_ratio <= 0.5:
-            return 10.0  # Excellent fit
-        elif adjusted_ratio <= 0.8:
-            return 8.0   # Good fit
-        elif adjusted_ratio <= 1.0:
-            return 6.0   # Acceptable fit
-        elif adjusted_ratio <= 1.2:
-            return 4.0   # Slightly over budget
-        else:
-            return 2.0   # Over budget
+        return _budget_fit(item_cost, user_budget, BUDGET_MULTIPLIERS.get(budget_type, 1.0))
     
     def calculate_weather_factor_score(self, destination: str, travel_month: int) -> float:
         """
         Calculate weather favorability score for the destination and time.
+        Memoized per engine: every activity of a trip shares the same (destination, month).
         """
+        key = (destination, travel_month)
+        score = self._weather_scores.get(key)
+        if score is None:
+            score = self._weather_scores[key] = self._compute_weather_factor_score(destination, travel_month)
+        return score
+    
+    def _compute_weather_factor_score(self, destination: str, travel_month: int) -> float:
+        """Uncached weather favorability score behind calculate_weather_factor_score."""
         # Try to get weather info from database first
         if self.db:
             try:
-                destinations_data = self._get_destinations_data()
-                dest_data = destinations_data.get(destination)
-                if dest_data and "best_months" in dest_data:
+                mask = self._get_best_months_masks().get(destination)
+                if mask is not None:
                     # Simple weather scoring based on best months
-                    if travel_month in dest_data["best_months"]:
-                        return 9.0
-                    else:
-                        return 5.0
+                    return 9.0 if (mask >> travel_month) & 1 else 5.0
             except Exception as e:
-                print(f"Warning: Database weather query failed, falling back to mock_data: {e}")
+                logger.warning("Database weather query failed, falling back to mock_data: %s", e)
         
         # Fallback to mock_data
         try:
-            from .mock_data import get_weather_conditions
-            weather_info = get_weather_conditions(destination, travel_month)
+            weather_info = _mock_data().get_weather_conditions(destination, travel_month)
             
             if weather_info["is_favorable"]:
                 return 9.0
@@ -258,128 +324,181 @@ class TripRecommendationEngine:
         """
         Score an activity based on user preferences and contextual factors.
         """
-        # Interest match score
-        interest_score = self.calculate_interest_match_score(
-            preferences.interests, activity.get("categories", [])
-        )
-        
-        # Budget fit score
-        activity_cost = activity["cost"].get(preferences.budget_type.value, activity["cost"]["mid"])
-        budget_score = self.calculate_budget_fit_score(activity_cost, daily_budget * 0.3, preferences.budget_type.value)
+        return self.score_activities_batch([activity], preferences, destination, travel_month, daily_budget)[0]
+    
+    def score_activities_batch(self, activities: List[Dict[str, Any]], preferences: UserPreferences,
+                               destination: str, travel_month: int, daily_budget: float) -> List[RecommendationScore]:
+        """
+        Score many activities in one pass; everything that depends only on the user,
+        destination and month is computed once up front.
+        """
+        interests = preferences.interests
+        profile = _interest_profile(tuple(interests)) if interests else None
+        budget_type = preferences.budget_type
+        budget_multiplier = BUDGET_MULTIPLIERS.get(budget_type, 1.0)
+        activity_budget = daily_budget * 0.3
         
-        # Weather factor
+        # Weather factor is the same for every activity of the trip
         weather_score = self.calculate_weather_factor_score(destination, travel_month)
-        
-        # Popularity score (based on rating)
-        popularity_score = (activity.get("rating", 4.0) / 5.0) * 10
+        weather_factor = round(weather_score, 2)
         
         # Activity intensity matching
         intensity_preferences = {"low": 1, "medium": 2, "high": 3}
-        activity_intensity = len(activity.get("categories", [])) + activity.get("duration", 2)
-        user_intensity = intensity_preferences.get(preferences.activity_intensity, 2)
-        
-        intensity_match = 10 - abs(activity_intensity - user_intensity * 2)
-        intensity_match = max(0, min(10, intensity_match))
-        
-        # Calculate overall score with weights
-        overall_score = (
-            interest_score * 0.35 +
-            budget_score * 0.25 +
-            weather_score * 0.15 +
-            popularity_score * 0.15 +
-            intensity_match * 0.10
-        )
+        user_intensity = intensity_preferences.get(preferences.activity_intensity, 2) * 2
         
-        return RecommendationScore(
-            overall_score=round(overall_score, 2),
-            interest_match=round(interest_score, 2),
-            budget_fit=round(budget_score, 2),
-            weather_factor=round(weather_score, 2),
-            popularity_score=round(popularity_score, 2)
-        )
+        scores = []
+        for activity in activities:
+            categories = activity.get("categories", [])
+            
+            # Interest match score
+            interest_score = _match_profile(profile, categories) if profile and categories else 5.0
+            
+            # Budget fit score
+            activity_cost = activity["cost"].get(budget_type, activity["cost"]["mid"])
+            budget_score = _budget_fit(activity_cost, activity_budget, budget_multiplier)
+            
+            # Popularity score (based on rating), clamped since ratings come from catalog data
+            popularity_score = min(10.0, max(0.0, (activity.get("rating", 4.0) / 5.0) * 10))
+            
+            activity_intensity = len(categories) + activity.get("duration", 2)
+            intensity_match = max(0, min(10, 10 - abs(activity_intensity - user_intensity)))
+            
+            # Calculate overall score with weights
+            overall_score = (
+                interest_score * 0.35 +
+                budget_score * 0.25 +
+                weather_score * 0.15 +
+                popularity_score * 0.15 +
+                intensity_match * 0.10
+            )
+            
+            # Every sub-score is bounded to 0-10 above and the weights sum to 1, so skip validation
+            scores.append(RecommendationScore.model_construct(
+                overall_score=round(overall_score, 2),
+                interest_match=round(interest_score, 2),
+                budget_fit=budget_score,
+                weather_factor=weather_factor,
+                popularity_score=round(popularity_score, 2)
+            ))
+        
+        return scores
     
     def score_hotel(self, hotel: Dict[str, Any], preferences: UserPreferences, 
                    daily_budget: float) -> RecommendationScore:
         """
         Score a hotel based on user preferences and budget.
         """
-        # Budget fit score
-        hotel_cost = hotel["price_per_night"].get(preferences.budget_type.value, hotel["price_per_night"]["mid"])
-        budget_score = self.calculate_budget_fit_score(hotel_cost, daily_budget * 0.5, preferences.budget_type.value)
-        
-        # Accommodation type matching
-        accommodation_match = 10.0 if hotel["category"] == preferences.accommodation_type.value else 6.0
-        
-        # Amenity matching based on interests
-        amenity_score = 5.0
-        if "spa" in hotel.get("amenities", []) and "wellness" in preferences.interests:
-            amenity_score += 2.0
-        if "gym" in hotel.get("amenities", []) and "adventure" in preferences.interests:
-            amenity_score += 1.5
-        if "restaurant" in hotel.get("amenities", []) and "culinary" in preferences.interests:
-            amenity_score += 1.5
-        
-        amenity_score = min(10.0, amenity_score)
-        
-        # Popularity score (based on rating)
-        popularity_score = (hotel.get("rating", 4.0) / 5.0) * 10
-        
-        # Overall score
-        overall_score = (
-            budget_score * 0.4 +
-            accommodation_match * 0.3 +
-            amenity_score * 0.2 +
-            popularity_score * 0.1
-        )
-        
-        return RecommendationScore(
-            overall_score=round(overall_score, 2),
-            interest_match=round(amenity_score, 2),
-            budget_fit=round(budget_score, 2),
-            weather_factor=8.0,  # Hotels are weather-independent
-            popularity_score=round(popularity_score, 2)
-        )
+        return self.score_hotels_batch([hotel], preferences, daily_budget)[0]
+    
+    def score_hotels_batch(self, hotels: List[Dict[str, Any]], preferences: UserPreferences,
+                           daily_budget: float) -> List[RecommendationScore]:
+        """
+        Score many hotels in one pass; the budget cap, accommodation type and
+        interest-driven amenity bonuses are resolved once up front.
+        """
+        budget_type = preferences.budget_type
+        budget_multiplier = BUDGET_MULTIPLIERS.get(budget_type, 1.0)
+        hotel_budget = daily_budget * 0.5
+        accommodation_type = preferences.accommodation_type.value
+        
+        # Amenity bonuses that apply for this user's interests
+        interests = set(preferences.interests)
+        amenity_bonuses = [
+            (amenity, bonus) for amenity, interest, bonus in
+            (("spa", "wellness", 2.0), ("gym", "adventure", 1.5), ("restaurant", "culinary", 1.5))
+            if interest in interests
+        ]
+        
+        scores = []
+        for hotel in hotels:
+            # Budget fit score
+            hotel_cost = hotel["price_per_night"].get(budget_type, hotel["price_per_night"]["mid"])
+            budget_score = _budget_fit(hotel_cost, hotel_budget, budget_multiplier)
+            
+            # Accommodation type matching
+            accommodation_match = 10.0 if hotel["category"] == accommodation_type else 6.0
+            
+            # Amenity matching based on interests
+            amenity_score = 5.0
+            if amenity_bonuses:
+                amenities = hotel.get("amenities", [])
+                for amenity, bonus in amenity_bonuses:
+                    if amenity in amenities:
+                        amenity_score += bonus
+            
+            amenity_score = min(10.0, amenity_score)
+            
+            # Popularity score (based on rating), clamped since ratings come from catalog data
+            popularity_score = min(10.0, max(0.0, (hotel.get("rating", 4.0) / 5.0) * 10))
+            
+            # Overall score
+            overall_score = (
+                budget_score * 0.4 +
+                accommodation_match * 0.3 +
+                amenity_score * 0.2 +
+                popularity_score * 0.1
+            )
+            
+            # Every sub-score is bounded to 0-10 above and the weights sum to 1, so skip validation
+            scores.append(RecommendationScore.model_construct(
+                overall_score=round(overall_score, 2),
+                interest_match=round(amenity_score, 2),
+                budget_fit=budget_score,
+                weather_factor=8.0,  # Hotels are weather-independent
+                popularity_score=round(popularity_score, 2)
+            ))
+        
+        return scores
     
     def optimize_daily_itinerary(self, activities: List[Dict[str, Any]], 
-                                preferences: UserPreferences, daily_budget: float) -> List[Dict[str, Any]]:
+                                preferences: UserPreferences, daily_budget: float,
+                                precomputed_scores: Optional[List[float]] = None,
+                                location_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
         """
         Optimize daily itinerary using constraint satisfaction and scoring.
+        Pass precomputed_scores (overall score per activity) to skip rescoring, and
+        location_ids (from _location_ids) to reuse the location numbering across days.
         """
         # Score all activities
-        scored_activities = []
-        for activity in activities:
-            score = self.score_activity(activity, preferences, "paris", 6, daily_budget)  # Default values
-            activity_with_score = activity.copy()
-            activity_with_score["score"] = score.overall_score
-            scored_activities.append(activity_with_score)
+        if precomputed_scores is None:
+            scores = self.score_activities_batch(activities, preferences, "paris", 6, daily_budget)  # Default values
+            precomputed_scores = [score.overall_score for score in scores]
         
-        # Sort by score
-        scored_activities.sort(key=lambda x: x["score"], reverse=True)
+        if location_ids is None:
+            location_ids = _location_ids(activities)
+        
+        # Best scored first (stable for ties)
+        ranking = sorted(range(len(activities)), key=precomputed_scores.__getitem__, reverse=True)
         
         # Select activities based on constraints
         selected_activities = []
         total_cost = 0
         total_duration = 0
-        used_locations = set()
+        used_locations = 0  # bit i set once location id i is visited
+        budget_type = preferences.budget_type
+        budget_cap = daily_budget * 0.6
         
         # Activity intensity constraints
         intensity_limits = {"low": 2, "medium": 3, "high": 4}
         max_activities = intensity_limits.get(preferences.activity_intensity, 3)
         
-        for activity in scored_activities:
-            activity_cost = activity["cost"].get(preferences.budget_type.value, activity["cost"]["mid"])
+        for i in ranking:
+            if len(selected_activities) >= max_activities:
+                break
+            
+            activity = activities[i]
+            activity_cost = activity["cost"].get(budget_type, activity["cost"]["mid"])
             
             # Check constraints
-            if (len(selected_activities) >= max_activities or
-                total_cost + activity_cost > daily_budget * 0.6 or
+            if (total_cost + activity_cost > budget_cap or
                 total_duration + activity["duration"] > 10 or
-                activity["location"] in used_locations):
+                (used_locations >> location_ids[i]) & 1):
                 continue
             
             selected_activities.append(activity)
             total_cost += activity_cost
             total_duration += activity["duration"]
-            used_locations.add(activity["location"])
+            used_locations |= 1 << location_ids[i]
         
         return selected_activities
     
@@ -400,21 +519,18 @@ class TripRecommendationEngine:
         
         if hotels is None:
             # Fallback to mock_data for hotels (database integration would need more work)
-            from .mock_data import get_hotels_for_destination
-            hotels = get_hotels_for_destination(request.destination, request.preferences.budget_type.value)
+            hotels = _mock_data().get_hotels_for_destination(request.destination, request.preferences.budget_type)
         
         if activities is None:
             # Fallback to mock_data for activities (database integration would need more work)
-            from .mock_data import get_activities_for_destination
-            activities = get_activities_for_destination(request.destination, request.preferences.interests)
+            activities = _mock_data().get_activities_for_destination(request.destination, request.preferences.interests)
         
         if weather_info is None:
-            start_date = datetime.fromisoformat(request.start_date)
-            weather_info = self._get_weather_info(request.destination, start_date.month)
+            weather_info = self._get_weather_info(request.destination, request.start_date.month, destination_data)
         else:
             # Convert dict to expected format
             is_favorable = weather_info.get("is_good_weather", True)
-            weather_info = WeatherInfo(
+            weather_info = WeatherInfo.model_construct(
                 temperature=weather_info.get("temperature", 25),
                 condition=weather_info.get("condition", "sunny"),
                 is_favorable=is_favorable,
@@ -422,58 +538,56 @@ class TripRecommendationEngine:
             )
         
         # Calculate trip duration
-        start_date = datetime.fromisoformat(request.start_date)
-        end_date = datetime.fromisoformat(request.end_date)
-        duration = (end_date - start_date).days
+        start_date = request.start_date
+        duration = (request.end_date - start_date).days
         travel_month = start_date.month
         
         # Get cost breakdown
-        cost_data = self._calculate_trip_cost(request.destination, duration, request.travelers, request.preferences.budget_type.value)
-        cost_breakdown = CostBreakdown(**cost_data)
+        cost_data = self._calculate_trip_cost(
+            request.destination, duration, request.travelers, request.preferences.budget_type, destination_data
+        )
+        # Trusted internal numbers: skip field validation
+        cost_breakdown = CostBreakdown.model_construct(**cost_data)
         
-        # Score and enhance hotels
-        enhanced_hotels = []
+        # Score hotels, then enhance only the top 3 (nlargest keeps sorted order and ties stable)
         daily_budget = cost_breakdown.per_day / request.travelers
-        
-        for hotel in hotels:
-            score = self.score_hotel(hotel, request.preferences, daily_budget)
-            enhanced_hotel = EnhancedHotel(**hotel, recommendation_score=score)
-            enhanced_hotels.append(enhanced_hotel)
-        
-        enhanced_hotels.sort(key=lambda x: x.recommendation_score.overall_score, reverse=True)
-        
-        # Score activities (activities already provided)
-        enhanced_activities = []
-        
-        for activity in activities:
-            score = self.score_activity(activity, request.preferences, request.destination, travel_month, daily_budget)
-            enhanced_activity = EnhancedActivity(**activity, recommendation_score=score)
-            enhanced_activities.append(enhanced_activity)
-        
-        enhanced_activities.sort(key=lambda x: x.recommendation_score.overall_score, reverse=True)
-        
-        # Generate daily itineraries
+        hotel_scores = self.score_hotels_batch(hotels, request.preferences, daily_budget)
+        top_hotels = heapq.nlargest(3, range(len(hotels)), key=lambda i: hotel_scores[i].overall_score)
+        enhanced_hotels = [_enhanced_hotel(hotels[i], hotel_scores[i]) for i in top_hotels]
+        
+        # Score activities (activities already provided), then enhance only the top 10
+        scores = self.score_activities_batch(activities, request.preferences, request.destination, travel_month, daily_budget)
+        overall_scores = [score.overall_score for score in scores]
+        location_ids = _location_ids(activities)
+        top_activities = heapq.nlargest(10, range(len(activities)), key=overall_scores.__getitem__)
+        enhanced_activities = [_enhanced_activity(activities[i], scores[i]) for i in top_activities]
+        
+        # Generate daily itineraries (built from trusted rows, so skip validation;
+        # Trip and TripRecommendation below still validate at the API boundary)
         itineraries = []
-        for day in range(duration):
-            current_date = start_date + timedelta(days=day)
-            
+        one_day = timedelta(days=1)
+        current_date = start_date
+        for _ in range(duration):
             # Optimize activities for this day
-            daily_activities = self.optimize_daily_itinerary(activities, request.preferences, daily_budget)
+            daily_activities = self.optimize_daily_itinerary(
+                activities, request.preferences, daily_budget,
+                precomputed_scores=overall_scores, location_ids=location_ids
+            )
             
             # Create visit places from activities
             places = []
             for i, activity in enumerate(daily_activities):
-                activity_cost = activity["cost"].get(request.preferences.budget_type.value, activity["cost"]["mid"])
+                activity_cost = float(activity["cost"].get(request.preferences.budget_type, activity["cost"]["mid"]))
                 
                 # Create events within the place
-                events = [Event(
+                events = [Event.model_construct(
                     name=activity["name"],
                     time=activity["best_time"],
                     description=activity["description"],
                     cost=activity_cost
                 )]
                 
-                place = VisitPlace(
+                place = VisitPlace.model_construct(
                     name=activity["location"],
                     times=f"{activity['best_time']} ({activity['duration']}h)",
                     description=f"Visit to {activity['location']} for {activity['name']}",
@@ -482,27 +596,30 @@ class TripRecommendationEngine:
                 )
                 places.append(place)
             
-            itinerary = Itinerary(
-                date=current_date.strftime("%Y-%m-%d"),
+            itinerary = Itinerary.model_construct(
+                date=current_date,
                 number_of_persons=request.travelers,
                 places=places
             )
             itineraries.append(itinerary)
+            current_date += one_day
         
         # Select best hotel
         selected_hotels = []
         if enhanced_hotels:
             best_hotel = enhanced_hotels[0]
-            hotel = Hotel(
+            hotel = Hotel.model_construct(
                 name=best_hotel.name,
                 check_in=request.start_date,
                 check_out=request.end_date,
-                cost_per_night=best_hotel.price_per_night[request.preferences.budget_type.value],
+                cost_per_night=best_hotel.price_per_night[request.preferences.budget_type],
                 address=best_hotel.location
             )
             selected_hotels.append(hotel)
         
-        # Create trip
+        # Create trip. Like TripRecommendation below, only its own fields are validated:
+        # pydantic accepts the model_construct'ed instances nested in it as-is
+        # (revalidate_instances='never'), so they must already be correct here
         trip = Trip(
             destination=destination_data["name"],
             start_date=request.start_date,
@@ -518,8 +635,8 @@ class TripRecommendationEngine:
         if request.preferences.interests:
             personalization_notes.append(f"Customized for your interests: {', '.join(request.preferences.interests)}")
         
-        if request.preferences.budget_type.value != "mid":
-            personalization_notes.append(f"Optimized for {request.preferences.budget_type.value} budget preferences")
+        if request.preferences.budget_type != "mid":
+            personalization_notes.append(f"Optimized for {request.preferences.budget_type} budget preferences")
         
         if weather_info.is_favorable:
             personalization_notes.append("Great weather conditions for your travel dates!")
@@ -537,28 +654,32 @@ class TripRecommendationEngine:
             trip=trip,
             weather_info=weather_info,
             cost_breakdown=cost_breakdown,
-            recommended_hotels=enhanced_hotels[:3],
-            recommended_activities=enhanced_activities[:10],
+            recommended_hotels=enhanced_hotels,
+            recommended_activities=enhanced_activities,
             personalization_notes=personalization_notes,
             confidence_score=round(confidence_score, 2)
         )
     
     def suggest_destinations(self, preferences: UserPreferences, 
-                           budget_range: Tuple[float, float] = None) -> List[DestinationSuggestion]:
+                           budget_range: Tuple[float, float] = None,
+                           top_k: int = 20) -> List[DestinationSuggestion]:
         """
-        Suggest destinations based on user preferences and budget.
+        Suggest the top_k destinations based on user preferences and budget.
+        Every destination is scored, but suggestions are only built for the winners.
         """
-        suggestions = []
         destinations_data = self._get_destinations_data()
+        interest_set = frozenset(preferences.interests)
         
-        for dest_key, dest_data in destinations_data.items():
+        # Score every destination: (rounded match score, dest_data, interest score, budget score)
+        scored = []
+        for dest_data in destinations_data.values():
             # Calculate interest match
             interest_score = self.calculate_interest_match_score(
                 preferences.interests, dest_data["categories"]
             )
             
             # Budget compatibility
-            daily_budget = dest_data["avg_daily_budget"].get(preferences.budget_type.value, 100)
+            daily_budget = dest_data["avg_daily_budget"].get(preferences.budget_type, 100)
             budget_score = 10.0
             if budget_range:
                 min_budget, max_budget = budget_range
@@ -569,34 +690,35 @@ class TripRecommendationEngine:
             
             # Overall match score
             match_score = (interest_score * 0.7 + budget_score * 0.3)
-            
+            scored.append((round(match_score, 2), dest_data, interest_score, budget_score))
+        
+        # Best match first (nlargest keeps sorted order and ties stable)
+        suggestions = []
+        for match_score, dest_data, interest_score, budget_score in heapq.nlargest(top_k, scored, key=lambda entry: entry[0]):
             # Generate reasons
             reasons = []
             if interest_score >= 8.0:
-                matching_interests = [cat for cat in dest_data["categories"] if cat in preferences.interests]
+                matching_interests = [cat for cat in dest_data["categories"] if cat in interest_set]
                 if matching_interests:
                     reasons.append(f"Perfect for {', '.join(matching_interests)} enthusiasts")
             
             if budget_score >= 8.0:
-                reasons.append(f"Great value for {preferences.budget_type.value} travelers")
+                reasons.append(f"Great value for {preferences.budget_type} travelers")
             
             if dest_data.get("best_months"):
                 reasons.append(f"Best visited in months: {', '.join(map(str, dest_data['best_months']))}")
             
-            suggestion = DestinationSuggestion(
+            suggestions.append(DestinationSuggestion(
                 name=dest_data["name"],
                 country=dest_data["country"],
                 description=dest_data["description"],
                 categories=dest_data["categories"],
                 best_months=dest_data["best_months"],
                 avg_daily_budget=dest_data["avg_daily_budget"],
-                match_score=round(match_score, 2),
+                match_score=match_score,
                 reasons=reasons
-            )
-            suggestions.append(suggestion)
+            ))
         
-        # Sort by match score
-        suggestions.sort(key=lambda x: x.match_score, reverse=True)
         return suggestions
 
 
@@ -4,10 +4,70 @@ Provides clean abstraction layer between business logic and database.
 """
 
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import and_, or_, bindparam, exists, select
 
-from .database import Destination, Hotel, Activity, TripTemplate, UserPreferenceTemplate
+import orjson
+
+from .database import (
+    Destination, Hotel, Activity, TripTemplate, UserPreferenceTemplate,
+    destination_categories, activity_categories, raw_json
+)
+
+# Columns read by the hotel/activity API dicts
+HOTEL_DATA_COLUMNS = (
+    Hotel.name, Hotel.category, Hotel.rating, Hotel.price_budget, Hotel.price_mid,
+    Hotel.price_luxury, Hotel.amenities, Hotel.location, Hotel.description
+)
+ACTIVITY_DATA_COLUMNS = (
+    Activity.name, Activity.type, Activity.duration, Activity.cost_budget, Activity.cost_mid,
+    Activity.cost_luxury, Activity.rating, Activity.description, Activity.best_time,
+    Activity.location, Activity.categories
+)
+
+# Hotel price column per budget type, for filtering hotels that offer the tier
+HOTEL_PRICE_COLUMNS = {
+    "budget": Hotel.price_budget,
+    "mid": Hotel.price_mid,
+    "luxury": Hotel.price_luxury
+}
+
+# Destination columns with the JSON lists left as unparsed fragments
+DESTINATION_RAW_COLUMNS = tuple(
+    raw_json(column) if column.key in ("categories", "best_months", "popular_areas") else column
+    for column in Destination.__table__.c
+)
+
+# Statements built once at import and reused with bound parameters, so each call
+# skips rebuilding the select construct
+DESTINATIONS_STMT = select(*Destination.__table__.c)
+DESTINATION_BY_KEY_STMT = DESTINATIONS_STMT.where(Destination.key == bindparam("key"))
+DESTINATION_RAW_BY_KEY_STMT = select(*DESTINATION_RAW_COLUMNS).where(Destination.key == bindparam("key"))
+DESTINATION_KEYS_STMT = select(Destination.key).order_by(Destination.id)
+
+HOTELS_DATA_STMT = (
+    select(*HOTEL_DATA_COLUMNS)
+    .join(Destination, Hotel.destination_id == Destination.id)
+    .where(Destination.key == bindparam("destination_key"))
+    .order_by(Hotel.rating.desc())
+)
+HOTELS_DATA_BY_TIER_STMTS = {
+    budget_type: HOTELS_DATA_STMT.where(price_column > 0)
+    for budget_type, price_column in HOTEL_PRICE_COLUMNS.items()
+}
+
+ACTIVITIES_DATA_STMT = (
+    select(*ACTIVITY_DATA_COLUMNS)
+    .join(Destination, Activity.destination_id == Destination.id)
+    .where(Destination.key == bindparam("destination_key"))
+    .order_by(Activity.rating.desc())
+)
+ACTIVITIES_DATA_BY_INTEREST_STMT = ACTIVITIES_DATA_STMT.where(
+    exists().where(
+        activity_categories.c.activity_id == Activity.id,
+        activity_categories.c.category.in_(bindparam("interests", expanding=True))
+    )
+)
 
 class DestinationRepository:
     """Repository for destination-related database operations."""
@@ -25,18 +85,45 @@ class DestinationRepository:
     
     def get_by_categories(self, categories: List[str]) -> List[Destination]:
         """Get destinations that match any of the given categories."""
-        destinations = []
-        for dest in self.db.query(Destination).all():
-            if any(cat in dest.categories for cat in categories):
-                destinations.append(dest)
-        return destinations
+        if not categories:
+            return []
+        matches_category = exists().where(
+            destination_categories.c.destination_id == Destination.id,
+            destination_categories.c.category.in_(categories)
+        )
+        return self.db.query(Destination).filter(matches_category).all()
+    
+    def get_all_data(self) -> List[Dict[str, Any]]:
+        """Get data for every destination in a single query, without hydrating ORM objects."""
+        rows = self.db.execute(DESTINATIONS_STMT).all()
+        return [self._to_data(row) for row in rows]
+    
+    def get_data_by_key(self) -> Dict[str, Dict[str, Any]]:
+        """Get data for every destination keyed by destination key, in a single query."""
+        rows = self.db.execute(DESTINATIONS_STMT).all()
+        return {row.key: self._to_data(row) for row in rows}
+    
+    def get_all_keys(self) -> List[str]:
+        """Get the key of every destination in a single query."""
+        return list(self.db.execute(DESTINATION_KEYS_STMT).scalars())
     
     def get_destination_data(self, key: str) -> Optional[Dict[str, Any]]:
         """Get comprehensive destination data."""
-        dest = self.get_by_key(key)
-        if not dest:
+        row = self.db.execute(DESTINATION_BY_KEY_STMT, {"key": key}).first()
+        if row is None:
             return None
-        
+        return self._to_data(row)
+    
+    def get_destination_json(self, key: str) -> Optional[bytes]:
+        """Serialize destination data with its stored JSON lists spliced in verbatim."""
+        row = self.db.execute(DESTINATION_RAW_BY_KEY_STMT, {"key": key}).first()
+        if row is None:
+            return None
+        return orjson.dumps(self._to_data(row))
+    
+    @staticmethod
+    def _to_data(dest) -> Dict[str, Any]:
+        """Build the API dict from a Destination or a destinations row."""
         return {
             "name": dest.name,
             "country": dest.country,
@@ -62,29 +149,39 @@ class HotelRepository:
     
     def get_by_destination(self, destination_key: str, budget_type: str = "mid") -> List[Hotel]:
         """Get hotels for a destination filtered by budget type."""
-        dest = self.db.query(Destination).filter(Destination.key == destination_key).first()
-        if not dest:
-            return []
-        
-        hotels = self.db.query(Hotel).filter(Hotel.destination_id == dest.id).all()
+        # One round trip: join on the destination key instead of looking the destination up first
+        query = (
+            self.db.query(Hotel)
+            .join(Destination, Hotel.destination_id == Destination.id)
+            .options(contains_eager(Hotel.destination))  # fill hotel.destination from the join
+            .filter(Destination.key == destination_key)
+            .order_by(Hotel.rating.desc())
+        )
         
-        # Filter by budget type preference (hotels that support the budget type)
-        filtered_hotels = []
-        for hotel in hotels:
-            if budget_type == "budget" and hotel.price_budget > 0:
-                filtered_hotels.append(hotel)
-            elif budget_type == "mid" and hotel.price_mid > 0:
-                filtered_hotels.append(hotel)
-            elif budget_type == "luxury" and hotel.price_luxury > 0:
-                filtered_hotels.append(hotel)
-        
-        return filtered_hotels if filtered_hotels else hotels
+        # Keep hotels that support the budget type, or all of them if none do
+        price_column = HOTEL_PRICE_COLUMNS.get(budget_type)
+        hotels = query.filter(price_column > 0).all() if price_column is not None else []
+        return hotels if hotels else query.all()
     
-    def get_hotels_data(self, destination_key: str) -> List[Dict[str, Any]]:
+    def get_hotels_data(self, destination_key: str, budget_type: str = "mid") -> List[Dict[str, Any]]:
         """Get hotel data in the format expected by the recommendation engine."""
-        hotels = self.get_by_destination(destination_key)
+        # Core select of just the response columns: no ORM identity map or instrumentation
+        params = {"destination_key": destination_key}
         
-        return [{
+        # Keep hotels that support the budget type, or all of them if none do
+        rows = []
+        tier_stmt = HOTELS_DATA_BY_TIER_STMTS.get(budget_type)
+        if tier_stmt is not None:
+            rows = self.db.execute(tier_stmt, params).all()
+        if not rows:
+            rows = self.db.execute(HOTELS_DATA_STMT, params).all()
+        
+        return [self._to_data(row) for row in rows]
+    
+    @staticmethod
+    def _to_data(hotel) -> Dict[str, Any]:
+        """Build the API dict from a Hotel or a hotels row."""
+        return {
             "name": hotel.name,
             "category": hotel.category,
             "rating": hotel.rating,
@@ -96,7 +193,7 @@ class HotelRepository:
             "amenities": hotel.amenities,
             "location": hotel.location,
             "description": hotel.description
-        } for hotel in hotels]
+        }
 
 class ActivityRepository:
     """Repository for activity-related database operations."""
@@ -106,28 +203,45 @@ class ActivityRepository:
     
     def get_by_destination(self, destination_key: str, interests: List[str] = None) -> List[Activity]:
         """Get activities for a destination filtered by interests."""
-        dest = self.db.query(Destination).filter(Destination.key == destination_key).first()
-        if not dest:
-            return []
-        
-        activities = self.db.query(Activity).filter(Activity.destination_id == dest.id).all()
+        # One round trip: join on the destination key instead of looking the destination up first
+        query = (
+            self.db.query(Activity)
+            .join(Destination, Activity.destination_id == Destination.id)
+            .options(contains_eager(Activity.destination))  # fill activity.destination from the join
+            .filter(Destination.key == destination_key)
+            .order_by(Activity.rating.desc())
+        )
         
         if not interests:
-            return activities
+            return query.all()
         
-        # Filter activities based on user interests
-        filtered_activities = []
-        for activity in activities:
-            if any(interest in activity.categories for interest in interests):
-                filtered_activities.append(activity)
+        # Filter activities based on user interests via the category index
+        matches_interest = exists().where(
+            activity_categories.c.activity_id == Activity.id,
+            activity_categories.c.category.in_(interests)
+        )
+        filtered_activities = query.filter(matches_interest).all()
         
-        return filtered_activities if filtered_activities else activities
+        return filtered_activities if filtered_activities else query.all()
     
     def get_activities_data(self, destination_key: str, interests: List[str] = None) -> List[Dict[str, Any]]:
         """Get activity data in the format expected by the recommendation engine."""
-        activities = self.get_by_destination(destination_key, interests)
+        # Core select of just the response columns: no ORM identity map or instrumentation
+        rows = []
+        if interests:
+            rows = self.db.execute(
+                ACTIVITIES_DATA_BY_INTEREST_STMT,
+                {"destination_key": destination_key, "interests": list(interests)}
+            ).all()
+        if not rows:
+            rows = self.db.execute(ACTIVITIES_DATA_STMT, {"destination_key": destination_key}).all()
         
-        return [{
+        return [self._to_data(row) for row in rows]
+    
+    @staticmethod
+    def _to_data(activity) -> Dict[str, Any]:
+        """Build the API dict from an Activity or an activities row."""
+        return {
             "name": activity.name,
             "type": activity.type,
             "duration": activity.duration,
@@ -141,7 +255,7 @@ class ActivityRepository:
             "best_time": activity.best_time,
             "location": activity.location,
             "categories": activity.categories
-        } for activity in activities]
+        }
 
 class TripTemplateRepository:
     """Repository for trip template operations."""
@@ -155,7 +269,8 @@ class TripTemplateRepository:
     
     def get_templates_data(self) -> List[Dict[str, Any]]:
         """Get trip templates in API format."""
-        templates = self.get_all()
+        # Core select: plain rows, no ORM objects whose attributes could lazy-load
+        templates = self.db.execute(select(*TripTemplate.__table__.c)).all()
         
         return [{
             "name": template.name,
@@ -190,7 +305,8 @@ class UserPreferenceTemplateRepository:
     
     def get_templates_data(self) -> List[Dict[str, Any]]:
         """Get user preference templates in API format."""
-        templates = self.get_all()
+        # Core select: plain rows, no ORM objects whose attributes could lazy-load
+        templates = self.db.execute(select(*UserPreferenceTemplate.__table__.c)).all()
         
         return [{
             "profile_type": template.profile_type,
@@ -3,74 +3,160 @@ Service layer for business logic.
 Provides clean separation between API controllers and data access.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+import heapq
 from sqlalchemy.orm import Session
 import random
-from datetime import datetime
 
+from .database import read_session_scope
 from .repositories import DataRepository
 from .recommendation_engine import TripRecommendationEngine
 from .models import TripRequest
+from .cache import data_generation
+
+# Weather simulation: private RNG and condition pools (good months use the first two)
+_WEATHER_RNG = random.Random()
+_WEATHER_CONDITIONS = ("sunny", "partly_cloudy", "cloudy", "rainy")
+_GOOD_WEATHER_CONDITIONS = _WEATHER_CONDITIONS[:2]
+
+# Analytics simulation: private RNG, one draw per destination
+_ANALYTICS_RNG = random.Random()
+
+def _draw_fields(rng: random.Random, count: int) -> Tuple[int, ...]:
+    """One getrandbits call sliced into count independent 16-bit fields."""
+    bits = rng.getrandbits(16 * count)
+    return tuple(bits >> shift & 0xFFFF for shift in range(0, 16 * count, 16))
+
+# Destination key for names containing each fragment, checked in order
+_NAME_FRAGMENT_KEYS = (
+    ("delhi", "delhi"),
+    ("mumbai", "mumbai"),
+    ("goa", "goa"),
+    ("jaipur", "rajasthan"),
+    ("rajasthan", "rajasthan"),
+    ("kerala", "kerala"),
+    ("himachal", "himachal"),
+    ("ladakh", "ladakh"),
+    ("andaman", "andaman"),
+)
+
+# Memoized catalog lookups on the read-only engine, keyed by data generation.
+# Results are shared between callers and must not be mutated.
+@lru_cache(maxsize=4)
+def _load_destinations_by_key(generation: int) -> Dict[str, Dict[str, Any]]:
+    with read_session_scope() as db:
+        return DataRepository(db).destinations.get_data_by_key()
+
+@lru_cache(maxsize=4)
+def _load_all_destinations(generation: int) -> Tuple[Dict[str, Any], ...]:
+    return tuple(_load_destinations_by_key(generation).values())
+
+@lru_cache(maxsize=4)
+def _destination_category_sets(generation: int) -> Tuple[frozenset, ...]:
+    """Category sets of _load_all_destinations, in the same order."""
+    return tuple(frozenset(dest["categories"]) for dest in _load_all_destinations(generation))
+
+@lru_cache(maxsize=4)
+def _load_trip_templates(generation: int) -> Tuple[Dict[str, Any], ...]:
+    with read_session_scope() as db:
+        return tuple(DataRepository(db).trip_templates.get_templates_data())
+
+@lru_cache(maxsize=4)
+def _load_user_preference_templates(generation: int) -> Tuple[Dict[str, Any], ...]:
+    with read_session_scope() as db:
+        return tuple(DataRepository(db).user_preferences.get_templates_data())
+
+def _load_destination(key: str, generation: int) -> Optional[Dict[str, Any]]:
+    return _load_destinations_by_key(generation).get(key)
+
+@lru_cache(maxsize=256)
+def _load_hotels(destination_key: str, budget_type: str, generation: int) -> Tuple[Dict[str, Any], ...]:
+    with read_session_scope() as db:
+        return tuple(DataRepository(db).hotels.get_hotels_data(destination_key, budget_type))
+
+@lru_cache(maxsize=256)
+def _load_activities(destination_key: str, interests: Tuple[str, ...], generation: int) -> Tuple[Dict[str, Any], ...]:
+    with read_session_scope() as db:
+        return tuple(DataRepository(db).activities.get_activities_data(destination_key, list(interests)))
+
+@lru_cache(maxsize=1024)
+def _weather_profile(destination_key: str, travel_month: int, generation: int) -> Optional[Tuple[int, int, Tuple[str, ...], bool, List[int]]]:
+    """Draw-independent weather inputs: (min temp, temp span, condition pool, good month, best months)."""
+    dest_data = _load_destination(destination_key, generation)
+    if not dest_data:
+        return None
+    temp_range = dest_data["avg_temp_range"]
+    best_months = dest_data["best_months"]
+    
+    # Simulate weather based on month
+    is_good_weather = travel_month in best_months
+    conditions = _GOOD_WEATHER_CONDITIONS if is_good_weather else _WEATHER_CONDITIONS
+    return temp_range["min"], temp_range["max"] - temp_range["min"] + 1, conditions, is_good_weather, best_months
 
 class TravelDataService:
     """Service for travel data operations."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, repo: Optional[DataRepository] = None):
         self.db = db
-        self.repo = DataRepository(db)
+        self.repo = repo if repo is not None else DataRepository(db)
     
     def get_all_destinations(self) -> List[Dict[str, Any]]:
         """Get all destinations with their data."""
-        destinations = self.repo.destinations.get_all()
-        return [self.repo.destinations.get_destination_data(dest.key) for dest in destinations]
+        return list(_load_all_destinations(data_generation()))
+    
+    def get_destination_keys(self) -> List[str]:
+        """Get the keys of all destinations."""
+        return self.repo.destinations.get_all_keys()
     
     def get_destination_by_key(self, key: str) -> Optional[Dict[str, Any]]:
         """Get destination data by key."""
-        return self.repo.destinations.get_destination_data(key)
+        destination = _load_destination(key, data_generation())
+        return dict(destination) if destination else None
+    
+    def get_destination_json(self, key: str) -> Optional[bytes]:
+        """Get destination data by key as a serialized JSON body."""
+        return self.repo.destinations.get_destination_json(key)
     
     def get_hotels_for_destination(self, destination_key: str, budget_type: str = "mid") -> List[Dict[str, Any]]:
         """Get hotels for a destination filtered by budget type."""
-        return self.repo.hotels.get_hotels_data(destination_key)
+        return list(_load_hotels(destination_key, budget_type, data_generation()))
     
     def get_activities_for_destination(self, destination_key: str, interests: List[str] = None) -> List[Dict[str, Any]]:
         """Get activities for a destination filtered by interests."""
-        return self.repo.activities.get_activities_data(destination_key, interests)
+        return list(_load_activities(destination_key, tuple(sorted(interests or ())), data_generation()))
     
     def get_trip_templates(self) -> List[Dict[str, Any]]:
         """Get all trip templates."""
-        return self.repo.trip_templates.get_templates_data()
+        return list(_load_trip_templates(data_generation()))
     
     def get_user_preference_templates(self) -> List[Dict[str, Any]]:
         """Get all user preference templates."""
-        return self.repo.user_preferences.get_templates_data()
+        return list(_load_user_preference_templates(data_generation()))
 
 class WeatherService:
     """Service for weather-related operations."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, repo: Optional[DataRepository] = None):
         self.db = db
-        self.repo = DataRepository(db)
+        self.repo = repo if repo is not None else DataRepository(db)
     
     def get_weather_conditions(self, destination_key: str, travel_month: int) -> Dict[str, Any]:
         """Simulate real-time weather conditions."""
-        dest_data = self.repo.destinations.get_destination_data(destination_key)
-        if not dest_data:
+        profile = _weather_profile(destination_key, travel_month, data_generation())
+        if profile is None:
             return {"temperature": 20, "condition": "unknown", "is_good_weather": False}
         
-        temp_range = dest_data["avg_temp_range"]
-        best_months = dest_data["best_months"]
-        
-        # Simulate weather based on month
-        is_good_weather = travel_month in best_months
-        temp = random.randint(temp_range["min"], temp_range["max"])
+        temp_min, temp_span, conditions, is_good_weather, best_months = profile
         
-        conditions = ["sunny", "partly_cloudy", "cloudy", "rainy"]
-        weather_condition = random.choice(conditions[:2] if is_good_weather else conditions)
+        temp_bits, condition_bits, humidity_bits = _draw_fields(_WEATHER_RNG, 3)
+        temp = temp_min + temp_bits % temp_span
+        weather_condition = conditions[condition_bits % len(conditions)]
         
         return {
             "temperature": temp,
             "condition": weather_condition,
-            "humidity": random.randint(40, 90),
+            "humidity": 40 + humidity_bits % 51,
             "is_good_weather": is_good_weather,
             "best_months": best_months
         }
@@ -80,9 +166,14 @@ class TripPlanningService:
     
     def __init__(self, db: Session):
         self.db = db
-        self.data_service = TravelDataService(db)
-        self.weather_service = WeatherService(db)
-        self.recommendation_engine = TripRecommendationEngine(db)
+        # One repository graph shared by both services
+        self.repo = DataRepository(db)
+        self.data_service = TravelDataService(db, repo=self.repo)
+        self.weather_service = WeatherService(db, repo=self.repo)
+        # Engine reads the memoized catalog instead of querying every destination per request
+        self.recommendation_engine = TripRecommendationEngine(
+            db, destinations_data=_load_destinations_by_key(data_generation())
+        )
     
     def plan_trip(self, request: TripRequest) -> Dict[str, Any]:
         """Plan a trip based on user request."""
@@ -102,10 +193,9 @@ class TripPlanningService:
         )
         
         # Get weather information
-        start_date = datetime.fromisoformat(request.start_date)
         weather_info = self.weather_service.get_weather_conditions(
             request.destination, 
-            start_date.month
+            request.start_date.month
         )
         
         # Generate recommendation using the engine
@@ -123,27 +213,21 @@ class TripPlanningService:
     
     def suggest_destinations(self, interests: List[str], budget_type: str) -> List[Dict[str, Any]]:
         """Suggest destinations based on interests and budget."""
-        destinations = self.data_service.get_all_destinations()
+        generation = data_generation()
+        destinations = _load_all_destinations(generation)
+        category_sets = _destination_category_sets(generation)
         
         # Score destinations based on interest match and budget fit
-        scored_destinations = []
-        for dest in destinations:
-            # Calculate interest match score
-            interest_score = len(set(interests) & set(dest["categories"])) / len(interests) if interests else 0
-            
-            # Calculate budget fit score
-            budget_key = f"budget_daily_{budget_type}"
-            budget_score = 1.0  # Default score
-            
-            # Add destination with score
-            scored_destinations.append({
-                **dest,
-                "recommendation_score": (interest_score * 0.7) + (budget_score * 0.3)
-            })
+        interest_set = frozenset(interests)
+        budget_score = 1.0  # Default score
+        scores = [
+            (len(interest_set & categories) / len(interests) if interests else 0) * 0.7 + budget_score * 0.3
+            for categories in category_sets
+        ]
         
-        # Sort by score and return top destinations
-        scored_destinations.sort(key=lambda x: x["recommendation_score"], reverse=True)
-        return scored_destinations[:5]
+        # Return the top destinations (nlargest keeps sorted order and ties stable)
+        top = heapq.nlargest(5, range(len(scores)), key=scores.__getitem__)
+        return [{**destinations[i], "recommendation_score": scores[i]} for i in top]
 
 class AnalyticsService:
     """Service for analytics and popular destinations."""
@@ -158,33 +242,23 @@ class AnalyticsService:
         
         # Simulate popularity data (in production, this would come from actual usage data)
         popular_destinations = []
-        for i, dest in enumerate(destinations):
-            popularity_score = random.uniform(3.5, 5.0)
+        for dest in destinations:
+            # Popularity (3.5-5.0), bookings (100-1000) and rating (4.0-4.8) from one draw
+            popularity_bits, bookings_bits, rating_bits = _draw_fields(_ANALYTICS_RNG, 3)
+            popularity_score = 3.5 + popularity_bits * (1.5 / 0xFFFF)
             # Extract key from destination name (simplified approach)
-            key = dest["name"].lower().split(",")[0].replace(" ", "_")
-            if "delhi" in dest["name"].lower():
-                key = "delhi"
-            elif "mumbai" in dest["name"].lower():
-                key = "mumbai"
-            elif "goa" in dest["name"].lower():
-                key = "goa"
-            elif "jaipur" in dest["name"].lower() or "rajasthan" in dest["name"].lower():
-                key = "rajasthan"
-            elif "kerala" in dest["name"].lower():
-                key = "kerala"
-            elif "himachal" in dest["name"].lower():
-                key = "himachal"
-            elif "ladakh" in dest["name"].lower():
-                key = "ladakh"
-            elif "andaman" in dest["name"].lower():
-                key = "andaman"
+            name = dest["name"].lower()
+            key = next(
+                (key for fragment, key in _NAME_FRAGMENT_KEYS if fragment in name),
+                name.split(",")[0].replace(" ", "_")
+            )
             
             popular_destinations.append({
                 "destination": dest["name"],
                 "key": key,
                 "popularity_score": round(popularity_score, 1),
-                "total_bookings": random.randint(100, 1000),
-                "avg_rating": round(random.uniform(4.0, 4.8), 1)
+                "total_bookings": 100 + bookings_bits % 901,
+                "avg_rating": round(4.0 + rating_bits * (0.8 / 0xFFFF), 1)
             })
         
         # Sort by popularity
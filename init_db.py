@@ -6,14 +6,30 @@ Creates tables and populates with data from JSON file.
 
 import json
 import sys
+from itertools import islice
 from pathlib import Path
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
+# Rows per executemany when seeding; bounds how many row dicts exist at once
+INSERT_BATCH_SIZE = 1000
+
+
+def insert_in_batches(db: Session, model, rows) -> int:
+    """Insert rows from an iterable in fixed-size batches and return how many were added."""
+    rows = iter(rows)
+    total = 0
+    while batch := list(islice(rows, INSERT_BATCH_SIZE)):
+        db.execute(insert(model), batch)
+        total += len(batch)
+    return total
+
+
 def init_database():
     """Initialize database with data from JSON file."""
     try:
         # Import after ensuring the app directory is in path
-        from app.database import SessionLocal, create_tables
+        from app.database import SessionLocal, create_tables, rebuild_junction_tables, bump_catalog_version, JUNCTION_SOURCES
         from app.database import Destination, Hotel, Activity, TripTemplate, UserPreferenceTemplate
         
         print("🗄️ Creating database tables...")
@@ -26,6 +42,8 @@ def init_database():
             print("❌ travel_data.json not found")
             return False
             
+        # Parsed in one go, not streamed: the file is ~40 KB and ijson is not a
+        # dependency. Only the insert side below is bounded by INSERT_BATCH_SIZE.
         with open(json_path, 'r') as f:
             data = json.load(f)
         
@@ -37,120 +55,110 @@ def init_database():
         try:
             # Clear existing data
             print("🗑️ Clearing existing data...")
+            for junction, *_ in JUNCTION_SOURCES:
+                db.execute(junction.delete())
             db.query(UserPreferenceTemplate).delete()
             db.query(TripTemplate).delete()
             db.query(Activity).delete()
             db.query(Hotel).delete()
             db.query(Destination).delete()
-            db.commit()
             
-            # Add destinations
+            # Add destinations (Core executemany batches fed by generators, no ORM unit of work)
             print("📍 Adding destinations...")
-            for dest_data in data["destinations"]:
-                destination = Destination(
-                    key=dest_data["key"],
-                    name=dest_data["name"],
-                    country=dest_data["country"],
-                    description=dest_data["description"],
-                    latitude=dest_data["latitude"],
-                    longitude=dest_data["longitude"],
-                    best_months=dest_data["best_months"],
-                    avg_temp_min=dest_data["avg_temp_min"],
-                    avg_temp_max=dest_data["avg_temp_max"],
-                    currency=dest_data["currency"],
-                    budget_daily_budget=dest_data["budget_daily_budget"],
-                    budget_daily_mid=dest_data["budget_daily_mid"],
-                    budget_daily_luxury=dest_data["budget_daily_luxury"],
-                    popular_areas=dest_data["popular_areas"],
-                    categories=dest_data["categories"]
-                )
-                db.add(destination)
-            db.commit()
+            insert_in_batches(db, Destination, ({
+                "key": dest_data["key"],
+                "name": dest_data["name"],
+                "country": dest_data["country"],
+                "description": dest_data["description"],
+                "latitude": dest_data["latitude"],
+                "longitude": dest_data["longitude"],
+                "best_months": dest_data["best_months"],
+                "avg_temp_min": dest_data["avg_temp_min"],
+                "avg_temp_max": dest_data["avg_temp_max"],
+                "currency": dest_data["currency"],
+                "budget_daily_budget": dest_data["budget_daily_budget"],
+                "budget_daily_mid": dest_data["budget_daily_mid"],
+                "budget_daily_luxury": dest_data["budget_daily_luxury"],
+                "popular_areas": dest_data["popular_areas"],
+                "categories": dest_data["categories"]
+            } for dest_data in data["destinations"]))
             
             # Get destination mappings for foreign keys
-            destinations = {dest.key: dest.id for dest in db.query(Destination).all()}
+            destinations = dict(db.execute(select(Destination.key, Destination.id)).all())
             
             # Add hotels
             if "hotels" in data:
                 print("🏨 Adding hotels...")
-                hotel_count = 0
-                for dest_key, hotels_list in data["hotels"].items():
-                    if dest_key in destinations:
-                        for hotel_data in hotels_list:
-                            hotel = Hotel(
-                                name=hotel_data["name"],
-                                destination_id=destinations[dest_key],
-                                category=hotel_data["category"],
-                                rating=hotel_data["rating"],
-                                location=hotel_data["location"],
-                                description=hotel_data["description"],
-                                price_budget=hotel_data["price_per_night"]["budget"],
-                                price_mid=hotel_data["price_per_night"]["mid"],
-                                price_luxury=hotel_data["price_per_night"]["luxury"],
-                                amenities=hotel_data["amenities"]
-                            )
-                            db.add(hotel)
-                            hotel_count += 1
-                db.commit()
+                hotel_count = insert_in_batches(db, Hotel, ({
+                    "name": hotel_data["name"],
+                    "destination_id": destinations[dest_key],
+                    "category": hotel_data["category"],
+                    "rating": hotel_data["rating"],
+                    "location": hotel_data["location"],
+                    "description": hotel_data["description"],
+                    "price_budget": hotel_data["price_per_night"]["budget"],
+                    "price_mid": hotel_data["price_per_night"]["mid"],
+                    "price_luxury": hotel_data["price_per_night"]["luxury"],
+                    "amenities": hotel_data["amenities"]
+                } for dest_key, hotels_list in data["hotels"].items() if dest_key in destinations
+                  for hotel_data in hotels_list))
                 print(f"✅ Added {hotel_count} hotels")
             
             # Add activities
             if "activities" in data:
                 print("🎯 Adding activities...")
-                activity_count = 0
-                for dest_key, activities_list in data["activities"].items():
-                    if dest_key in destinations:
-                        for activity_data in activities_list:
-                            activity = Activity(
-                                name=activity_data["name"],
-                                destination_id=destinations[dest_key],
-                                type=activity_data["type"],
-                                duration=activity_data["duration"],
-                                rating=activity_data["rating"],
-                                description=activity_data["description"],
-                                best_time=activity_data["best_time"],
-                                location=activity_data["location"],
-                                cost_budget=activity_data["cost"]["budget"],
-                                cost_mid=activity_data["cost"]["mid"],
-                                cost_luxury=activity_data["cost"]["luxury"],
-                                categories=activity_data["categories"]
-                            )
-                            db.add(activity)
-                            activity_count += 1
-                db.commit()
+                activity_count = insert_in_batches(db, Activity, ({
+                    "name": activity_data["name"],
+                    "destination_id": destinations[dest_key],
+                    "type": activity_data["type"],
+                    "duration": activity_data["duration"],
+                    "rating": activity_data["rating"],
+                    "description": activity_data["description"],
+                    "best_time": activity_data["best_time"],
+                    "location": activity_data["location"],
+                    "cost_budget": activity_data["cost"]["budget"],
+                    "cost_mid": activity_data["cost"]["mid"],
+                    "cost_luxury": activity_data["cost"]["luxury"],
+                    "categories": activity_data["categories"]
+                } for dest_key, activities_list in data["activities"].items() if dest_key in destinations
+                  for activity_data in activities_list))
                 print(f"✅ Added {activity_count} activities")
             
             # Add trip templates
             print("📋 Adding trip templates...")
-            for template_data in data["trip_templates"]:
-                template = TripTemplate(
-                    name=template_data["name"],
-                    description=template_data["description"],
-                    interests=template_data["interests"],
-                    budget_type=template_data["budget_type"],
-                    travel_style=template_data["travel_style"],
-                    accommodation_type=template_data["accommodation_type"],
-                    activity_intensity=template_data["activity_intensity"],
-                    recommended_destinations=template_data["recommended_destinations"],
-                    duration_min=template_data["duration_min"],
-                    duration_max=template_data["duration_max"],
-                    highlights=template_data["highlights"]
-                )
-                db.add(template)
-            db.commit()
+            insert_in_batches(db, TripTemplate, ({
+                "name": template_data["name"],
+                "description": template_data["description"],
+                "interests": template_data["interests"],
+                "budget_type": template_data["budget_type"],
+                "travel_style": template_data["travel_style"],
+                "accommodation_type": template_data["accommodation_type"],
+                "activity_intensity": template_data["activity_intensity"],
+                "recommended_destinations": template_data["recommended_destinations"],
+                "duration_min": template_data["duration_min"],
+                "duration_max": template_data["duration_max"],
+                "highlights": template_data["highlights"]
+            } for template_data in data["trip_templates"]))
             
             # Add user preference templates
             print("👤 Adding user preference templates...")
-            for template_data in data["user_preference_templates"]:
-                template = UserPreferenceTemplate(
-                    profile_type=template_data["profile_type"],
-                    interests=template_data["interests"],
-                    budget_preference=template_data["budget_preference"],
-                    accommodation_type=template_data["accommodation_type"],
-                    activity_intensity=template_data["activity_intensity"],
-                    group_size_preference=template_data["group_size_preference"]
-                )
-                db.add(template)
+            insert_in_batches(db, UserPreferenceTemplate, ({
+                "profile_type": template_data["profile_type"],
+                "interests": template_data["interests"],
+                "budget_preference": template_data["budget_preference"],
+                "accommodation_type": template_data["accommodation_type"],
+                "activity_intensity": template_data["activity_intensity"],
+                "group_size_preference": template_data["group_size_preference"]
+            } for template_data in data["user_preference_templates"]))
+            
+            # Index categories and amenities in the junction tables
+            print("🔗 Building category and amenity indexes...")
+            rebuild_junction_tables(db)
+            
+            # Running servers compare this version to drop their cached catalog
+            bump_catalog_version(db)
+            
+            # Everything above is one transaction: a single commit, and a failure leaves the old catalog intact
             db.commit()
             
             print("🎉 Database initialization completed successfully!")
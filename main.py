@@ -4,6 +4,8 @@ Main entry point for the AI-Powered Trip Planner application.
 Run this file to start the FastAPI server.
 """
 
+import os
+
 import uvicorn
 from app.main import app
 
@@ -13,10 +15,23 @@ if __name__ == "__main__":
     print("📚 API Documentation: http://localhost:8000/api/docs")
     print("🎯 Frontend Interface: http://localhost:8000")
     
-    uvicorn.run(
-        "app.main:app",  # Import string instead of app object
-        host="0.0.0.0", 
-        port=8000,
-        reload=True,  # Enable auto-reload for development
-        log_level="info"
-    )
+    if os.getenv("ENV") == "prod":
+        # Multi-process server on the uvloop event loop with the httptools parser
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WORKERS", os.cpu_count() or 1)),
+            loop="uvloop",
+            http="httptools",
+            reload=False,
+            log_level="warning"
+        )
+    else:
+        uvicorn.run(
+            "app.main:app",  # Import string instead of app object
+            host="0.0.0.0", 
+            port=8000,
+            reload=True,  # Enable auto-reload for development
+            log_level="info"
+        )
@@ -0,0 +1,23 @@
+"""
+Shared fixtures for the API regression tests.
+The app reads DATABASE_URL at import, so it is pointed at a throwaway SQLite file first.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='trip-planner-tests-')}/travel_planner.db"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient over the app, with the catalog seeded from data/travel_data.json."""
+    from fastapi.testclient import TestClient
+    from init_db import init_database
+    from app.main import app
+
+    assert init_database()
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,154 @@
+"""
+Endpoint regression tests for trip planning, the precomputed content
+bodies and catalog-version invalidation.
+"""
+
+import time
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app import cache
+from app.database import SessionLocal, Hotel, bump_catalog_version
+
+TRIP_REQUEST = {
+    "destination": "goa",
+    "start_date": "2025-12-01",
+    "end_date": "2025-12-05",
+    "travelers": 2,
+    "budget_total": 50000,
+    "preferences": {"interests": ["beach", "adventure"], "budget_type": "mid"},
+}
+
+
+def assert_scores_in_range(items):
+    for item in items:
+        for value in item["recommendation_score"].values():
+            assert 0 <= value <= 10
+
+
+# === /trip/plan ===
+
+def test_plan_trip_builds_a_day_by_day_itinerary(client):
+    response = client.post("/trip/plan", json=TRIP_REQUEST)
+    assert response.status_code == 200
+    plan = response.json()
+    
+    trip = plan["trip"]
+    assert trip["destination"] == "Goa, India"
+    # One itinerary day per night: start date up to, not including, the end date
+    start = date.fromisoformat(TRIP_REQUEST["start_date"])
+    assert [day["date"] for day in trip["itinerary"]] == [
+        (start + timedelta(days=offset)).isoformat() for offset in range(4)
+    ]
+    assert all(day["number_of_persons"] == 2 for day in trip["itinerary"])
+    assert trip["hotels"] and trip["hotels"][0]["name"] == plan["recommended_hotels"][0]["name"]
+    
+    assert plan["recommended_hotels"] and plan["recommended_activities"]
+    assert_scores_in_range(plan["recommended_hotels"])
+    assert_scores_in_range(plan["recommended_activities"])
+    assert 0 <= plan["confidence_score"] <= 10
+
+
+def test_plan_trip_cost_breakdown_adds_up(client):
+    costs = client.post("/trip/plan", json=TRIP_REQUEST).json()["cost_breakdown"]
+    parts = costs["accommodation"] + costs["activities"] + costs["food"] + costs["transport"]
+    assert costs["total"] == pytest.approx(parts)
+    assert costs["per_person"] == pytest.approx(costs["total"] / TRIP_REQUEST["travelers"])
+
+
+def test_plan_trip_costs_rise_with_budget_tier(client):
+    totals = {}
+    for tier in ("budget", "mid", "luxury"):
+        request = dict(TRIP_REQUEST, preferences={"interests": ["cultural"], "budget_type": tier})
+        totals[tier] = client.post("/trip/plan", json=request).json()["cost_breakdown"]["total"]
+    assert totals["budget"] < totals["mid"] < totals["luxury"]
+
+
+def test_plan_trip_unknown_destination_is_a_client_error(client):
+    response = client.post("/trip/plan", json=dict(TRIP_REQUEST, destination="atlantis"))
+    assert response.status_code == 400
+    assert "atlantis" in response.json()["detail"]
+
+
+def test_plan_trip_rejects_unknown_budget_type(client):
+    request = dict(TRIP_REQUEST, preferences={"interests": [], "budget_type": "premium"})
+    assert client.post("/trip/plan", json=request).status_code == 422
+
+
+# === /activities and /hotels ===
+
+def test_activities_list_every_activity_for_a_destination(client):
+    activities = client.get("/activities/goa").json()
+    assert activities
+    assert all({"name", "cost", "categories", "rating"} <= set(activity) for activity in activities)
+    # The precomputed body does not depend on the budget tier
+    assert client.get("/activities/goa", params={"budget_type": "luxury"}).json() == activities
+
+
+def test_activities_filtered_by_interest(client):
+    activities = client.get("/activities/goa", params={"interests": "beach"}).json()
+    assert activities
+    assert all("beach" in activity["categories"] for activity in activities)
+
+
+def test_hotels_priced_for_the_requested_tier(client):
+    for budget_type in ("budget", "mid", "luxury"):
+        hotels = client.get("/hotels/goa", params={"budget_type": budget_type}).json()
+        assert hotels
+        assert all(budget_type in hotel["price_per_night"] for hotel in hotels)
+
+
+def test_unknown_destination_has_no_content(client):
+    assert client.get("/activities/atlantis").json() == []
+    assert client.get("/hotels/atlantis").json() == []
+
+
+def test_content_endpoints_reject_unknown_budget_type(client):
+    assert client.get("/hotels/goa", params={"budget_type": "premium"}).status_code == 422
+    assert client.get("/activities/goa", params={"budget_type": "premium"}).status_code == 422
+
+
+# === Catalog-version invalidation ===
+
+def rename_hotel(old_name, new_name):
+    """Rename a hotel and bump the catalog version in one commit, as a reseed would."""
+    with SessionLocal() as db:
+        db.execute(update(Hotel).where(Hotel.name == old_name).values(name=new_name))
+        bump_catalog_version(db)
+        db.commit()
+
+
+def wait_for(fetch, predicate, timeout=10.0):
+    """Poll an endpoint until its body satisfies predicate (the rebuild runs in the background)."""
+    deadline = time.monotonic() + timeout
+    while True:
+        body = fetch()
+        if predicate(body) or time.monotonic() > deadline:
+            return body
+        time.sleep(0.05)
+
+
+def test_catalog_version_bump_refreshes_cached_bodies(client, monkeypatch):
+    monkeypatch.setattr(cache, "GENERATION_CHECK_INTERVAL", 0.0)
+    
+    def hotel_names():
+        return [hotel["name"] for hotel in client.get("/hotels/goa").json()]
+    
+    def destination_names():
+        return [destination["name"] for destination in client.get("/destinations").json()]
+    
+    old_name = hotel_names()[0]
+    destination_names()  # fill the response cache before the change
+    rename_hotel(old_name, "Renamed Test Hotel")
+    try:
+        names = wait_for(hotel_names, lambda names: "Renamed Test Hotel" in names)
+        assert "Renamed Test Hotel" in names and old_name not in names
+        plan = client.post("/trip/plan", json=TRIP_REQUEST).json()
+        assert old_name not in [hotel["name"] for hotel in plan["recommended_hotels"]]
+    finally:
+        rename_hotel("Renamed Test Hotel", old_name)
+    
+    names = wait_for(hotel_names, lambda names: old_name in names)
+    assert old_name in names